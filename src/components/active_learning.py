@@ -2,6 +2,7 @@ import os
 import json
 import time
 import pickle
+import threading
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
 
@@ -32,6 +33,9 @@ class ActiveLearning:
         self.confidence_thresholds = self._load_or_create("confidence_thresholds.pkl", {})
         self.pattern_cache = self._load_or_create("pattern_cache.pkl", {})
         
+        # Guards query effectiveness updates, which may arrive from a background writer
+        self._lock = threading.Lock()
+        
         # Track statistics
         self.stats = {
             "total_verifications": 0,
@@ -113,6 +117,39 @@ class ActiveLearning:
         if self.logger:
             self.logger.debug(f"Recording query effectiveness: {query}")
         
+        with self._lock:
+            self._apply_query_effectiveness(query, athlete_info, platform, found_matches, highest_confidence)
+            
+            # Save updated data
+            self._save_data("query_effectiveness.pkl", self.query_effectiveness)
+    
+    def record_query_effectiveness_batch(self, records: List[Tuple[str, Dict[str, Any], str, int, float]]) -> None:
+        """
+        Record the effectiveness of several search queries with a single save.
+        
+        Args:
+            records: List of (query, athlete_info, platform, found_matches, highest_confidence) tuples
+        """
+        if not records:
+            return
+        
+        if self.logger:
+            self.logger.debug(f"Recording query effectiveness for {len(records)} queries")
+        
+        with self._lock:
+            for query, athlete_info, platform, found_matches, highest_confidence in records:
+                self._apply_query_effectiveness(query, athlete_info, platform, found_matches, highest_confidence)
+            
+            # Save updated data
+            self._save_data("query_effectiveness.pkl", self.query_effectiveness)
+    
+    def _apply_query_effectiveness(self, 
+                                 query: str, 
+                                 athlete_info: Dict[str, Any], 
+                                 platform: str, 
+                                 found_matches: int, 
+                                 highest_confidence: float) -> None:
+        """Update the in-memory effectiveness stats for one query without saving."""
         # Extract query patterns
         query_words = query.lower().split()
         sport = athlete_info.get('Sport', 'unknown').lower()
@@ -155,9 +192,6 @@ class ActiveLearning:
         self.query_effectiveness[query]["by_sport"][sport]["uses"] += 1
         self.query_effectiveness[query]["by_sport"][sport]["matches"] += found_matches
         self.query_effectiveness[query]["by_sport"][sport]["total_confidence"] += highest_confidence
-        
-        # Save updated data
-        self._save_data("query_effectiveness.pkl", self.query_effectiveness)
     
     def suggest_queries(self, 
                       athlete_info: Dict[str, Any], 
@@ -219,7 +253,10 @@ class ActiveLearning:
         # Find most effective queries for this sport and platform
         effective_queries = []
         
-        for query, stats in self.query_effectiveness.items():
+        with self._lock:
+            query_stats = list(self.query_effectiveness.items())
+        
+        for query, stats in query_stats:
             # Skip queries with no matches
             if stats["found_matches"] == 0:
                 continue
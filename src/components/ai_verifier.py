@@ -4,6 +4,7 @@ import json
 import base64
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from bs4 import BeautifulSoup
 
@@ -24,6 +25,16 @@ class AIVerifier:
         # Initialize caches
         self.query_cache = {}
         self.verification_cache = {}
+        
+        # Single-prompt verdicts from verify_profile_matches_batch; kept apart so they never
+        # stand in for the multi-stage verification cached in verification_cache
+        self.batch_verification_cache = {}
+        
+        # Maximum number of OpenAI requests issued in parallel
+        self.max_concurrent_requests = 8
+        
+        # Search result pages analyzed together in one request by analyze_search_results_batch
+        self.max_pages_per_analysis = 6
 
     def verify_profile_match(self, 
                           athlete_info: Dict[str, Any], 
@@ -100,6 +111,131 @@ class AIVerifier:
             # Fall back to original confidence score
             return confidence_score > 0.6, confidence_score, f"Verification failed: {str(e)}"
             
+    def verify_profile_matches_batch(self, 
+                                     athlete_info: Dict[str, Any], 
+                                     candidates: List[Tuple[str, str, Dict[str, Any], float]]) -> List[Tuple[bool, float, str]]:
+        """
+        Verify several candidate profiles for the same athlete with a single AI request.
+        
+        Args:
+            athlete_info: Dict containing athlete information
+            candidates: List of (platform, url, profile_data, prior_confidence) tuples
+            
+        Returns:
+            List of (is_match, adjusted_confidence, reasoning) tuples in candidate order
+        """
+        athlete_name = f"{athlete_info.get('First_Name', '')} {athlete_info.get('Last_Name', '')}"
+        results: List[Optional[Tuple[bool, float, str]]] = [None] * len(candidates)
+        
+        # Serve cached verifications and collect the rest
+        pending = []
+        for i, (platform, url, profile_data, prior) in enumerate(candidates):
+            cache_key = f"{athlete_name}_{hash(json.dumps(profile_data, sort_keys=True))}"
+            if cache_key in self.verification_cache:
+                results[i] = self.verification_cache[cache_key]
+            elif cache_key in self.batch_verification_cache:
+                results[i] = self.batch_verification_cache[cache_key]
+            else:
+                pending.append((i, cache_key))
+        
+        # A single candidate gets the full multi-stage verification
+        if len(pending) == 1:
+            i, _ = pending[0]
+            platform, url, profile_data, prior = candidates[i]
+            results[i] = self.verify_profile_match(athlete_info, profile_data, prior)
+            pending = []
+        
+        if pending:
+            if self.logger:
+                self.logger.info(f"Performing batch verification of {len(pending)} candidates for {athlete_name} using {self.model}")
+            
+            prompt = f"""
+            Determine which of these candidate profiles belong to the NCAA football player described below.
+            
+            TARGET ATHLETE:
+            - Name: {athlete_name}
+            - Sport: {athlete_info.get('Sport', 'Football')}
+            - State: {athlete_info.get('State', 'Unknown')}
+            - School/College: {athlete_info.get('School', 'Unknown')}
+            - Position: {athlete_info.get('Position', 'Unknown')}
+            - Year: {athlete_info.get('Year', 'Unknown')}
+            
+            CANDIDATES:
+            """
+            for number, (i, _) in enumerate(pending, start=1):
+                platform, url, profile_data, prior = candidates[i]
+                prompt += f"\n{number}. {platform.capitalize()}: {url} (initial confidence {prior * 100:.0f}%)\n"
+                if profile_data.get('screenshot_analysis'):
+                    prompt += f"   Screenshot analysis: {profile_data['screenshot_analysis']}\n"
+            
+            prompt += f"""
+            For each candidate:
+            1. Decide whether it belongs to an NCAA football player at all
+            2. Check name patterns in the URL/username against {athlete_name}
+            3. Consider whether it could be someone else with the same name
+            4. Note any disqualifying evidence (different sport, age, location, profession)
+            
+            Judge each candidate independently; several may belong to the athlete.
+            
+            Provide your response as JSON with this structure:
+            {{
+                "results": [
+                    {{
+                        "candidate": 1,
+                        "is_match": true/false,
+                        "confidence": 0-100,
+                        "reasoning": "detailed explanation of your analysis"
+                    }},
+                    ...
+                ]
+            }}
+            """
+            
+            system_instruction = "You are an expert at verifying if profiles belong to a specific NCAA football player. Focus on distinguishing the target athlete from others with similar names."
+            
+            try:
+                # Set up completion parameters
+                completion_params = {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": system_instruction},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+                
+                # Only add response_format if not using o1-preview
+                if not self.model.startswith("o1-"):
+                    completion_params["response_format"] = {"type": "json_object"}
+                    completion_params["temperature"] = 0.2
+                    
+                completion = self.client.chat.completions.create(**completion_params)
+                response_data = json.loads(completion.choices[0].message.content)
+                
+                for entry in response_data.get("results", []):
+                    number = entry.get("candidate")
+                    if not isinstance(number, int) or not 1 <= number <= len(pending):
+                        continue
+                    i, cache_key = pending[number - 1]
+                    result_tuple = (
+                        bool(entry.get("is_match", False)),
+                        entry.get("confidence", 50) / 100.0,  # Convert from percentage
+                        entry.get("reasoning", "No detailed reasoning provided")
+                    )
+                    results[i] = result_tuple
+                    self.batch_verification_cache[cache_key] = result_tuple
+                    
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error in batch verification for {athlete_name}: {str(e)}")
+        
+        # Anything the batch didn't answer goes through individual verification
+        for i, result_tuple in enumerate(results):
+            if result_tuple is None:
+                platform, url, profile_data, prior = candidates[i]
+                results[i] = self.verify_profile_match(athlete_info, profile_data, prior)
+        
+        return results
+    
     def generate_advanced_search_queries(self, athlete_info: Dict[str, Any]) -> Tuple[List[str], str]:
         """
         Generate highly specific search queries using AI reasoning.
@@ -535,6 +671,157 @@ class AIVerifier:
                 self.logger.error(f"Error analyzing search results for {athlete_name}: {str(e)}")
             return []
     
+    def analyze_search_results_concurrent(self, 
+                                         search_results_list: List[str], 
+                                         athlete_info: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """
+        Analyze several search result pages in parallel.
+        
+        Args:
+            search_results_list: HTML content of each search results page
+            athlete_info: Dict containing athlete information
+            
+        Returns:
+            List of candidate profile lists, in the same order as the input pages
+        """
+        if not search_results_list:
+            return []
+        
+        workers = min(self.max_concurrent_requests, len(search_results_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda html: self.analyze_search_results(html, athlete_info),
+                search_results_list
+            ))
+    
+    def analyze_search_results_batch(self, 
+                                    pages: List[Tuple[str, str, str]], 
+                                    athlete_info: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """
+        Analyze several search result pages for the same athlete with as few AI requests as possible.
+        
+        Args:
+            pages: List of (query, platform_domain, html) tuples; platform_domain is "" for general searches
+            athlete_info: Dict containing athlete information
+            
+        Returns:
+            List of candidate profile lists, in the same order as the input pages
+        """
+        if not pages:
+            return []
+        
+        # Split into groups small enough for one prompt and run the groups in parallel
+        size = self.max_pages_per_analysis
+        groups = [pages[start:start + size] for start in range(0, len(pages), size)]
+        workers = min(self.max_concurrent_requests, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analyses = executor.map(lambda group: self._analyze_search_page_group(group, athlete_info), groups)
+            return [candidates for group_result in analyses for candidates in group_result]
+    
+    def _analyze_search_page_group(self, 
+                                   pages: List[Tuple[str, str, str]], 
+                                   athlete_info: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """Analyze one group of search result pages in a single request, falling back per page."""
+        athlete_name = f"{athlete_info.get('First_Name', '')} {athlete_info.get('Last_Name', '')}"
+        if len(pages) == 1:
+            return [self.analyze_search_results(pages[0][2], athlete_info)]
+        
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(pages)
+        if self.logger:
+            self.logger.info(f"Analyzing {len(pages)} search result pages for {athlete_name} with {self.model}")
+        
+        prompt = f"""
+            Analyze these search result pages to identify links that are most likely to be the social media profiles or contact information for this NCAA athlete:
+            
+            ATHLETE INFO:
+            - Name: {athlete_name}
+            - Sport: {athlete_info.get('Sport', 'Unknown')}
+            - School/College: {athlete_info.get('School', 'Unknown')}
+            - Position: {athlete_info.get('Position', 'Unknown')}
+            - Year: {athlete_info.get('Year', 'Unknown')}
+            """
+        for number, (query, domain, html) in enumerate(pages, start=1):
+            soup = BeautifulSoup(html, 'html.parser')
+            extracted_links = [
+                a['href'] for a in soup.find_all('a', href=True)
+                if any(d in a['href'] for d in ['twitter.com', 'facebook.com', 'instagram.com', '.edu'])
+            ][:20]
+            prompt += f"""
+            === PAGE {number} (query: {query}{f', restricted to {domain}' if domain else ''}) ===
+            SEARCH RESULTS TEXT:
+            {soup.get_text()[:1500]}
+            
+            EXTRACTED LINKS:
+            {', '.join(extracted_links)}
+            """
+        
+        prompt += """
+            For each page, list the links that might be relevant, with your confidence level (0-100%) and the evidence for it.
+            Be especially careful to distinguish this athlete from others with similar names.
+            Include every page in your answer, with an empty list if it has no likely candidates.
+            
+            IMPORTANT: Format your response as valid, parseable JSON with this exact structure:
+            {
+                "pages": [
+                    {
+                        "page": 1,
+                        "candidate_profiles": [
+                            {
+                                "url": "the profile URL",
+                                "platform": "twitter/facebook/instagram/email/phone/other",
+                                "confidence": 85,
+                                "reasoning": "detailed explanation of why this is likely the correct athlete"
+                            }
+                        ]
+                    },
+                    ...
+                ]
+            }
+            """
+        
+        system_instruction = "You are an expert at identifying NCAA athletes in search results. Analyze these results to find the most likely matches for the specified athlete."
+        
+        try:
+            # Set up completion parameters
+            completion_params = {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_instruction},
+                    {"role": "user", "content": prompt}
+                ]
+            }
+            
+            # Only add response_format if not using o1-preview
+            if not self.model.startswith("o1-"):
+                completion_params["response_format"] = {"type": "json_object"}
+                completion_params["temperature"] = 0.2
+            
+            completion = self.client.chat.completions.create(**completion_params)
+            response_data = json.loads(completion.choices[0].message.content)
+            
+            for entry in response_data.get("pages", []):
+                number = entry.get("page")
+                if not isinstance(number, int) or not 1 <= number <= len(pages):
+                    continue
+                candidates = entry.get("candidate_profiles", [])
+                
+                # Convert confidence from percentage to decimal
+                for candidate in candidates:
+                    if "confidence" in candidate:
+                        candidate["confidence"] = candidate["confidence"] / 100.0
+                results[number - 1] = candidates
+                
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error in batch search analysis for {athlete_name}: {str(e)}")
+        
+        # Any page the batch didn't answer is analyzed on its own
+        for i, candidates in enumerate(results):
+            if candidates is None:
+                results[i] = self.analyze_search_results(pages[i][2], athlete_info)
+        
+        return results
+    
     def analyze_profile_content(self, 
                                profile_url: str, 
                                profile_content: str, 
@@ -49,6 +49,8 @@ def main():
     parser.add_argument('--search-query-model', default='gpt-4o', help='OpenAI model to use for search query generation (gpt-4o recommended)')
     parser.add_argument('--vision-model', default='gpt-4o', help='OpenAI model to use for vision verification (gpt-4o recommended)')
     parser.add_argument('--vision-enabled', action='store_true', help='Enable vision verification for social media profiles')
+    parser.add_argument('--screenshot-workers', type=int, default=1, help='Headless browsers used to capture profile screenshots in parallel (vision only)')
+    parser.add_argument('--save-screenshots', action='store_true', help='Also write profile screenshots to disk for debugging (vision only)')
     parser.add_argument('--active-learning', action='store_true', help='Enable active learning to improve results over time')
     parser.add_argument('--timeout', type=int, default=45, help='Timeout per athlete in seconds')
     args = parser.parse_args()
@@ -96,7 +98,8 @@ def main():
         print(f"Successfully loaded {len(df)} athletes")
 
         print("Setting up Chrome driver with session persistence...")
-        driver = setup_chrome_driver(enable_cookies=True)
+        # Images are only needed when profile screenshots are sent for vision verification
+        driver = setup_chrome_driver(enable_cookies=True, load_images=args.vision_enabled)
         
         # Authenticate with social media platforms
         print("Authenticating with social media platforms...")
@@ -149,6 +152,8 @@ def main():
         
         # Set vision enabled flag
         scraper.vision_enabled = vision_enabled
+        scraper.screenshot_workers = args.screenshot_workers
+        scraper.persist_screenshots = args.save_screenshots
         
         # Set active learning component
         scraper.active_learning = active_learning
@@ -274,6 +279,8 @@ def main():
     finally:
         if 'progress' in locals():
             progress.close()
+        if 'scraper' in locals():
+            scraper.close()
         if 'driver' in locals():
             driver.quit()
         print("Program finished.")
@@ -1,13 +1,22 @@
 import time
 import random
+import heapq
 import urllib.parse
 import re
 import json
 import os
 import base64
+import io
+import hashlib
+import pickle
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import string
 from bs4 import BeautifulSoup
+from PIL import Image
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -15,6 +24,135 @@ from selenium.common.exceptions import TimeoutException, WebDriverException, NoS
 from typing import Dict, Optional, List, Tuple, Any
 from utils.url_validator import URLValidator
 from utils.social_media_auth import SocialMediaAuth
+from utils.driver import setup_chrome_driver
+from utils.driver_pool import DriverPool
+from utils.rate_limiter import TokenBucket
+
+# Contact detail patterns, compiled once
+_EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+_PHONE_PATTERN = r"""
+    (?:\+?1[-.\s]?)?          # Optional country code
+    (?:\s*\(?\d{3}\)?[-.\s]?)  # Area code
+    \d{3}[-.\s]?            # First 3 digits
+    \d{4}                   # Last 4 digits
+    """
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+_PHONE_RE = re.compile(_PHONE_PATTERN, re.VERBOSE)
+_BASIC_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_NONDIGIT_RE = re.compile(r"\D")
+
+# Disposable email providers, matched anywhere in the domain
+_DISPOSABLE_RE = re.compile(r"tempmail|throwaway|temporary|mailinator|guerrillamail")
+
+# Common email providers accepted outright
+_COMMON_PROVIDERS = frozenset(['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'aol.com'])
+
+# Single-pass pattern for emails and phone numbers in raw HTML.
+# Alternatives are tried in order, so emails win over the digits they contain.
+_CONTACT_RE = re.compile(rf"""
+    (?P<email>{_EMAIL_PATTERN})
+    | (?P<phone>{_PHONE_PATTERN})
+    """, re.VERBOSE)
+
+# Source credibility signals for candidate URLs
+_EDU_ATHLETICS_RE = re.compile(r'athletics|sports|roster')
+_OFFICIAL_NCAA_RE = re.compile(r'ncaa\.com|goffrogs\.com')
+_PROFILE_PAGE_RE = re.compile(r'roster|player|bio|profile')
+_NON_SPORTS_RE = re.compile(r'linkedin\.com|indeed\.com|career')
+
+# Social media domains and the platform each belongs to
+_PLATFORM_BY_DOMAIN = {
+    'twitter.com': 'twitter',
+    'facebook.com': 'facebook',
+    'instagram.com': 'instagram'
+}
+
+# Elements that show a search engine has rendered its results (or its "no results" notice)
+_SEARCH_READY_SELECTOR = "li.b_algo, .b_no, [data-testid='result'], [data-testid='no-results-message']"
+_SEARCH_READY_TIMEOUT = 5
+
+# Per-platform page handling: the element that marks profile content as rendered and how far to scroll
+_PLATFORM_CONFIG = {
+    'twitter': {'wait_selector': '[data-testid="primaryColumn"]', 'scroll': 300},
+    'facebook': {'wait_selector': '[role="main"]', 'scroll': 300},
+    'instagram': {'wait_selector': 'main', 'scroll': 300}
+}
+_DEFAULT_PAGE_CONFIG = {'wait_selector': 'body', 'scroll': 300}
+
+# True once the document has loaded and every visible image in the profile container has finished
+# loading (lazy images below the fold never start, so they are not waited for)
+_IMAGES_LOADED_SCRIPT = """
+if (document.readyState !== 'complete') return false;
+const root = document.querySelector(arguments[0]) || document;
+return Array.from(root.querySelectorAll('img')).every((img) => {
+    const rect = img.getBoundingClientRect();
+    return img.complete || rect.bottom <= 0 || rect.top >= window.innerHeight;
+});
+"""
+_IMAGES_LOADED_TIMEOUT = 5
+
+# Quoted href attribute values in raw HTML
+_HREF_RE = re.compile(r"""href\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+# A bare US phone number mistaken for a URL
+_BARE_PHONE_RE = re.compile(r'^\d{3}[-.\s]?\d{3}[-.\s]?\d{4}$')
+
+# Screenshots are downscaled to this width and stored as JPEG before vision analysis
+_SCREENSHOT_MAX_WIDTH = 768
+_SCREENSHOT_JPEG_QUALITY = 75
+
+# Confidence cap applied when boosting a candidate of the given credibility
+_CREDIBILITY_CAPS = {"high": 0.9, "medium": 0.85}
+
+# Phrases in a vision analysis that signal a match or non-match
+_VISION_POSITIVE_RE = re.compile(
+    r"appears to be the correct athlete|likely belongs to|high confidence this is"
+    r"|strong evidence this is|profile matches|confirmed match",
+    re.IGNORECASE
+)
+_VISION_NEGATIVE_RE = re.compile(
+    r"does not appear to be|unlikely to be|no evidence this is"
+    r"|cannot confirm this is|different person|not a match",
+    re.IGNORECASE
+)
+_VISION_STRONG_POSITIVE_RE = re.compile(r"confirmed match|strong evidence", re.IGNORECASE)
+_VISION_STRONG_NEGATIVE_RE = re.compile(r"definitely not|clearly not", re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
+def _classify_url(url: str) -> Tuple[Optional[str], float, str, bool]:
+    """
+    Classify a lowercased candidate URL by source credibility.
+    
+    Returns:
+        Tuple of (credibility or None, confidence boost, reasoning note, is non-sports site)
+    """
+    non_sports = bool(_NON_SPORTS_RE.search(url))
+    
+    if '.edu' in url and _EDU_ATHLETICS_RE.search(url):
+        return "high", 0.2, "Official .edu athletics source", non_sports
+    if _OFFICIAL_NCAA_RE.search(url):
+        return "high", 0.2, "Official NCAA source", non_sports
+    if _PROFILE_PAGE_RE.search(url):
+        return "medium", 0.1, "Player roster/profile page", non_sports
+    
+    return None, 0.0, "", non_sports
+
+
+def _platform_from_url(url: str) -> Optional[str]:
+    """Return the social media platform a URL or domain belongs to, or None."""
+    url_lower = url.lower()
+    for domain, platform in _PLATFORM_BY_DOMAIN.items():
+        if domain in url_lower:
+            return platform
+    return None
+
+
+@lru_cache(maxsize=65536)
+def _validate_profile_url(url_validator: URLValidator, url: str, platform: str) -> Optional[str]:
+    """Memoized URLValidator.clean_and_validate_url; profile URLs recur across athletes."""
+    return url_validator.clean_and_validate_url(url, platform)
+
 
 class EnhancedScraperService:
     def __init__(self, driver, logger, success_logger, ai_verifier=None, vision_model='gpt-4o'):
@@ -29,8 +167,35 @@ class EnhancedScraperService:
         self.max_retries = 3
         self.vision_enabled = False  # Vision is disabled by default
         self.vision_model = vision_model  # Model to use for vision verification
+        self.screenshot_workers = 1  # Headless browsers used for parallel screenshots (1 = use main driver)
+        self.driver_pools: Dict[str, DriverPool] = {}  # Per-platform screenshot browsers, created on first parallel capture
+        self.platform_rate = 0.5  # Profile page loads per second allowed for each platform
+        self.platform_burst = 2
+        self.rate_limiters: Dict[str, TokenBucket] = {}
+        self._rate_limiters_lock = threading.Lock()
+        self.max_vision_images = 4  # Screenshots sent per vision request
+        self.vision_min_confidence = 0.3  # Text confidence range in which a profile is checked with vision
+        self.vision_max_confidence = 0.85
+        self._io_pool = ThreadPoolExecutor(max_workers=4)  # Encodes and writes screenshots off the driver thread
         self.active_learning = None  # Active learning component (optional)
         self.auth_handler = None  # Will be set when verify_login_before_scraping is called
+        self._login_fn = {}  # platform -> bound login method of the auth handler
+        
+        # Homepage visited before logging in to each platform
+        self._homepage = {
+            "twitter": "https://twitter.com/",
+            "facebook": "https://www.facebook.com/",
+            "instagram": "https://www.instagram.com/"
+        }
+        
+        # Recent login checks per platform: platform -> (checked_at, logged_in)
+        self._login_status_cache: Dict[str, Tuple[float, bool]] = {}
+        self.login_status_ttl = 300  # 5 minutes; sessions don't drop that quickly
+        
+        # Query effectiveness records are written to active learning in the background
+        self._effectiveness_queue = queue.Queue()
+        self._effectiveness_thread = threading.Thread(target=self._drain_effectiveness, daemon=True)
+        self._effectiveness_thread.start()
         
         # Initialize URL validator
         self.url_validator = URLValidator(logger)
@@ -39,6 +204,32 @@ class EnhancedScraperService:
         self.screenshot_dir = os.path.join("data", "screenshots")
         if not os.path.exists(self.screenshot_dir):
             os.makedirs(self.screenshot_dir)
+        
+        # Screenshots are kept in memory for vision; set to write them to screenshot_dir as well
+        self.persist_screenshots = False
+        
+        # Recent screenshots by URL: url -> (captured_at, future resolving to an image data URL)
+        self._screenshot_cache: Dict[str, Tuple[float, Future]] = {}
+        self._screenshot_cache_lock = threading.Lock()
+        self.screenshot_cache_ttl = 3600  # 1 hour
+        
+        # Persistent vision results by (url, athlete): key -> (verified_at, result)
+        self.vision_cache_path = os.path.join("data", "cache", "vision_cache.pkl")
+        self.vision_cache_ttl = 7 * 24 * 3600  # 7 days
+        self.vision_cache = self._load_timed_cache(self.vision_cache_path, self.vision_cache_ttl)
+        self._vision_cache_lock = threading.Lock()
+        
+        # Digests of (profile URL, athlete) pairs verified as clear non-matches: digest -> (rejected_at, True).
+        # Entries expire so a single wrong verdict can't hide the right profile forever
+        self.mismatch_cache_path = os.path.join("data", "cache", "mismatch_cache.pkl")
+        self.mismatch_threshold = 0.3
+        self.mismatch_cache_ttl = 7 * 24 * 3600  # 7 days
+        self.known_mismatches = self._load_timed_cache(self.mismatch_cache_path, self.mismatch_cache_ttl)
+        
+        # Extraction results of traditional searches: "query|domain" -> (searched_at, results)
+        self.search_cache_path = os.path.join("data", "cache", "search_cache.pkl")
+        self.search_cache_ttl = 3600  # 1 hour
+        self.search_cache = self._load_timed_cache(self.search_cache_path, self.search_cache_ttl)
     
     def verify_login_before_scraping(self, auth_handler, platforms=None):
         """
@@ -55,6 +246,16 @@ class EnhancedScraperService:
             platforms = ['twitter', 'facebook', 'instagram']
         
         self.auth_handler = auth_handler
+        self._login_fn = {
+            "twitter": auth_handler.login_twitter,
+            "facebook": auth_handler.login_facebook,
+            "instagram": auth_handler.login_instagram
+        }
+        
+        # Skip the forced re-login while every platform was verified recently
+        if all(self._get_cached_login_status(platform) for platform in platforms):
+            self.logger.info("Login status verified recently for all platforms, skipping re-login")
+            return True
         
         # Force login for all platforms to ensure we're properly authenticated
         self.logger.info("Forcing login on all platforms to ensure proper authentication")
@@ -63,11 +264,7 @@ class EnhancedScraperService:
         all_logged_in = True
         for platform in platforms:
             # First take a verification screenshot to debug
-            self.driver.get(
-                "https://twitter.com/" if platform == 'twitter' else
-                "https://facebook.com/" if platform == 'facebook' else
-                "https://instagram.com/"
-            )
+            self.driver.get(self._homepage[platform])
             time.sleep(3)
             auth_handler._take_auth_screenshot(f"{platform}_pre_verification")
             
@@ -78,23 +275,18 @@ class EnhancedScraperService:
             self.logger.info(f"Initiating direct login for {platform} before scraping")
             
             # Attempt login
-            success = False
-            if platform == 'twitter':
-                success, message = auth_handler.login_twitter()
-            elif platform == 'facebook':
-                success, message = auth_handler.login_facebook()
-            elif platform == 'instagram':
-                success, message = auth_handler.login_instagram()
-                
+            success, message = self._login_fn[platform]()
             if not success:
                 self.logger.error(f"Failed to login to {platform} before scraping: {message}")
                 return False
             else:
                 self.logger.info(f"Successfully logged in to {platform}: {message}")
+                # A fresh login supersedes whatever status was cached before
+                self._login_status_cache.pop(platform, None)
         
         # Do a final verification
         for platform in platforms:
-            if not auth_handler._check_login_status(platform, extended_check=True):
+            if not self._check_login_status_cached(platform, extended_check=True):
                 self.logger.error(f"Login verification failed for {platform} after login attempt")
                 return False
         
@@ -116,22 +308,20 @@ class EnhancedScraperService:
             return False
             
         # Check if we're still logged in
-        if self.auth_handler._check_login_status(platform):
+        if self._check_login_status_cached(platform):
             return True
             
         self.logger.warning(f"Session expired for {platform} during scraping, attempting to re-login")
+        self._login_status_cache.pop(platform, None)
         
         # Handle cookie consent
         self.auth_handler.handle_cookie_consent(platform)
         
         # Attempt login
+        login_fn = self._login_fn.get(platform)
         success = False
-        if platform == 'twitter':
-            success, _ = self.auth_handler.login_twitter()
-        elif platform == 'facebook':
-            success, _ = self.auth_handler.login_facebook()
-        elif platform == 'instagram':
-            success, _ = self.auth_handler.login_instagram()
+        if login_fn:
+            success, _ = login_fn()
             
         if not success:
             self.logger.error(f"Failed to re-login to {platform} during scraping")
@@ -139,6 +329,72 @@ class EnhancedScraperService:
             
         return True
     
+    def close(self):
+        """Flush pending background work before the driver is shut down."""
+        if self._effectiveness_thread.is_alive():
+            self._effectiveness_queue.put(None)
+            self._effectiveness_thread.join(timeout=10)
+        
+        # Persist traditional search extractions and rejected profiles for the next run
+        self._save_timed_cache(self.search_cache_path, self.search_cache)
+        self._save_timed_cache(self.mismatch_cache_path, self.known_mismatches)
+        
+        # Shut down screenshot browsers and finish pending screenshot writes
+        for pool in self.driver_pools.values():
+            pool.close()
+        self.driver_pools = {}
+        self._io_pool.shutdown(wait=True)
+    
+    def _drain_effectiveness(self):
+        """Write queued query effectiveness records in batches of up to 100 or every second."""
+        while True:
+            record = self._effectiveness_queue.get()
+            if record is None:
+                return
+            
+            batch = [record]
+            stop = False
+            deadline = time.monotonic() + 1.0
+            while len(batch) < 100:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = self._effectiveness_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if record is None:
+                    stop = True
+                    break
+                batch.append(record)
+            
+            try:
+                if self.active_learning:
+                    self.active_learning.record_query_effectiveness_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Error recording query effectiveness: {str(e)}")
+            
+            if stop:
+                return
+    
+    def _get_cached_login_status(self, platform: str) -> Optional[bool]:
+        """Return the cached login status for a platform, or None if missing or stale."""
+        cached = self._login_status_cache.get(platform)
+        if cached and time.monotonic() - cached[0] < self.login_status_ttl:
+            return cached[1]
+        return None
+    
+    def _check_login_status_cached(self, platform: str, extended_check: bool = False) -> bool:
+        """Check login status through the auth handler, serving recent results from cache."""
+        cached = self._get_cached_login_status(platform)
+        if cached is not None:
+            return cached
+        
+        # This cache is the only TTL layer, so bypass the auth handler's own verification window
+        logged_in = self.auth_handler._check_login_status(platform, extended_check=extended_check, force=True)
+        self._login_status_cache[platform] = (time.monotonic(), logged_in)
+        return logged_in
+    
     def get_profile_info(self, first_name: str, last_name: str, context: Dict[str, Any] = None) -> Dict[str, Optional[str]]:
         """Retrieve profile info using enhanced AI-driven search and verification."""
         full_name = f"{first_name} {last_name}"
@@ -163,10 +419,13 @@ class EnhancedScraperService:
         if context:
             athlete_info.update(context)
         
+        # Search result pages fetched for this athlete, keyed by query
+        serp_cache = {}
+        
         # If we don't have much context, try to acquire it dynamically
         if not context or (not context.get('School') and not context.get('Position')):
             state = context.get('State') if context else None
-            acquired_context = self._acquire_dynamic_context(first_name, last_name, state)
+            acquired_context, serp_cache = self._acquire_dynamic_context(first_name, last_name, state)
             
             # Only update with acquired context if we found something useful
             if acquired_context.get("confidence", 0) > 0.2:
@@ -187,7 +446,7 @@ class EnhancedScraperService:
         # Use enhanced AI-driven search if available
         if self.ai_verifier:
             self.logger.info(f"Using enhanced AI-driven search for {full_name}")
-            return self._enhanced_ai_search(athlete_info, platforms)
+            return self._enhanced_ai_search(athlete_info, platforms, serp_cache)
         else:
             # Fall back to traditional search
             self.logger.info(f"Using traditional search for {full_name} (AI verifier not available)")
@@ -224,10 +483,17 @@ class EnhancedScraperService:
                     continue
                 
                 self.driver.get(url)
-                time.sleep(2)  # Wait for page to load
+                
+                # Pages load eagerly, so wait for the results themselves rather than a fixed delay
+                try:
+                    WebDriverWait(self.driver, min(wait_time, _SEARCH_READY_TIMEOUT)).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, _SEARCH_READY_SELECTOR))
+                    )
+                except TimeoutException:
+                    self.logger.debug(f"No result elements appeared on {engine}; reading the page as loaded")
                 
                 # Get page source
-                html = self.driver.page_source
+                html = self._get_html()
                 
                 # Check if we got a valid response
                 if "No results found" in html or "did not match any documents" in html:
@@ -254,12 +520,25 @@ class EnhancedScraperService:
                     self.retry_count = 0
                     return ""  # Return empty string instead of None for better error handling
     
+    def _get_html(self) -> str:
+        """Read the current page HTML with a single CDP call, falling back to page_source."""
+        try:
+            response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                "expression": "document.documentElement.outerHTML",
+                "returnByValue": True
+            })
+            return response["result"]["value"]
+        except Exception as e:
+            # Non-Chromium drivers don't support CDP commands
+            self.logger.debug(f"CDP HTML fetch failed, using page_source: {str(e)}")
+            return self.driver.page_source
+    
     def random_delay(self):
         """Introduce a random delay to avoid detection."""
         delay = random.uniform(1.0, 3.0)
         time.sleep(delay)
     
-    def _acquire_dynamic_context(self, first_name: str, last_name: str, state: Optional[str] = None) -> Dict[str, Any]:
+    def _acquire_dynamic_context(self, first_name: str, last_name: str, state: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, str]]:
         """
         Attempt to dynamically acquire NCAA context for an athlete.
         
@@ -269,7 +548,8 @@ class EnhancedScraperService:
             state: Optional state information
             
         Returns:
-            Dictionary with acquired context and confidence score
+            Tuple of (dictionary with acquired context and confidence score,
+            search result HTML keyed by query for reuse in the main search)
         """
         full_name = f"{first_name} {last_name}"
         self.logger.info(f"Acquiring NCAA context for {full_name}")
@@ -290,11 +570,15 @@ class EnhancedScraperService:
             "confidence": 0.0
         }
         
+        # Keep the result pages so the main search doesn't fetch them again
+        serp_cache = {}
+        
         # Run context-gathering searches
         for query in context_queries:
             html = self.search_platform(query, "")
             if not html:
                 continue
+            serp_cache[query] = html
                 
             # Use AI to extract potential context
             if self.ai_verifier:
@@ -465,10 +749,13 @@ class EnhancedScraperService:
         acquired_context["username_patterns"] = username_patterns
         
         self.logger.info(f"Acquired context for {full_name}: {acquired_context}")
-        return acquired_context
+        return acquired_context, serp_cache
     
-    def _enhanced_ai_search(self, athlete_info: Dict[str, Any], platforms: Dict[str, str]) -> Dict[str, Optional[str]]:
+    def _enhanced_ai_search(self, athlete_info: Dict[str, Any], platforms: Dict[str, str],
+                            serp_cache: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
         """Perform enhanced AI-driven search with multi-stage verification."""
+        if serp_cache is None:
+            serp_cache = {}
         full_name = f"{athlete_info['First_Name']} {athlete_info['Last_Name']}"
         result = {
             "email": None,
@@ -522,52 +809,65 @@ class EnhancedScraperService:
         
         # Track candidate profiles across all searches
         all_candidates = []
+        seen_urls = set()  # URLs of every candidate collected so far
         
-        # Stage 2: Execute searches and collect candidates
+        # Stage 2: Execute searches and collect result pages
+        # Pages are gathered first so the AI analysis can run concurrently afterwards
+        search_pages = []  # (query, domain, platform key, html)
         for query in queries:
             self.logger.info(f"Executing query: {query}")
             
-            # Perform general search
-            html = self.search_platform(query, "")
+            # Perform general search, reusing pages already fetched for this athlete
+            html = serp_cache.get(query) or self.search_platform(query, "")
             if html:
-                # Let AI analyze the search results
-                candidates = self.ai_verifier.analyze_search_results(html, athlete_info)
+                serp_cache[query] = html
+                search_pages.append((query, "", "", html))
+            
+            # Also perform platform-specific searches
+            for domain, key in platforms.items():
+                platform_query = f"{query} site:{domain}"
+                html = serp_cache.get(platform_query) or self.search_platform(platform_query, domain)
+                if html:
+                    serp_cache[platform_query] = html
+                    search_pages.append((platform_query, domain, key, html))
                 
+                self.random_delay()
+        
+        # Let AI analyze all result pages concurrently
+        analyses = self.ai_verifier.analyze_search_results_concurrent(
+            [page[3] for page in search_pages], athlete_info
+        )
+        
+        # Merge the analyzed candidates in search order
+        for (query, domain, key, html), candidates in zip(search_pages, analyses):
+            if not domain:
                 # Add source credibility scoring
                 for candidate in candidates:
-                    url = candidate.get("url", "").lower()
+                    credibility, boost, note, non_sports = _classify_url(candidate.get("url", "").lower())
                     
                     # Boost confidence for official sources
-                    if '.edu' in url and any(term in url for term in ['athletics', 'sports', 'roster']):
-                        candidate["confidence"] = min(0.9, candidate.get("confidence", 0) + 0.2)
-                        candidate["source_credibility"] = "high"
-                        candidate["reasoning"] += " | Official .edu athletics source"
-                    elif 'ncaa.com' in url or 'goffrogs.com' in url:
-                        candidate["confidence"] = min(0.9, candidate.get("confidence", 0) + 0.2)
-                        candidate["source_credibility"] = "high"
-                        candidate["reasoning"] += " | Official NCAA source"
-                    elif any(term in url for term in ['roster', 'player', 'bio', 'profile']):
-                        candidate["confidence"] = min(0.85, candidate.get("confidence", 0) + 0.1)
-                        candidate["source_credibility"] = "medium"
-                        candidate["reasoning"] += " | Player roster/profile page"
+                    if credibility:
+                        candidate["confidence"] = min(_CREDIBILITY_CAPS[credibility], candidate.get("confidence", 0) + boost)
+                        candidate["source_credibility"] = credibility
+                        candidate["reasoning"] += f" | {note}"
                     
                     # Penalize non-sports sites
-                    if any(term in url for term in ['linkedin.com', 'indeed.com', 'career']):
+                    if non_sports:
                         candidate["confidence"] = max(0.1, candidate.get("confidence", 0) - 0.3)
                         candidate["reasoning"] += " | Likely professional profile (not sports)"
                 
                 all_candidates.extend(candidates)
+                seen_urls.update(candidate.get("url") for candidate in candidates)
                 
                 # Record query effectiveness if active learning is enabled
                 if self.active_learning:
                     highest_confidence = max([c.get("confidence", 0) for c in candidates]) if candidates else 0
-                    self.active_learning.record_query_effectiveness(
-                        query, athlete_info, "", len(candidates), highest_confidence
+                    self._effectiveness_queue.put(
+                        (query, athlete_info, "", len(candidates), highest_confidence)
                     )
                 
                 # Extract contact info directly as backup
-                emails = self.extract_emails(html)
-                phones = self.extract_phones(html)
+                emails, phones = self._extract_contacts(html)
                 
                 # Add emails and phones as candidates
                 for email in emails:
@@ -585,6 +885,7 @@ class EnhancedScraperService:
                         "confidence": confidence,
                         "reasoning": reasoning
                     })
+                    seen_urls.add(email)
                 
                 for phone in phones:
                     all_candidates.append({
@@ -593,41 +894,34 @@ class EnhancedScraperService:
                         "confidence": 0.5,
                         "reasoning": "Phone found in search results"
                     })
-            
-            # Also perform platform-specific searches
-            for domain, key in platforms.items():
-                platform_query = f"{query} site:{domain}"
-                html = self.search_platform(platform_query, domain)
-                if html:
-                    # Let AI analyze the platform-specific results
-                    platform_candidates = self.ai_verifier.analyze_search_results(html, athlete_info)
-                    
-                    # Add platform information
-                    for candidate in platform_candidates:
-                        candidate["platform"] = key
-                    
-                    all_candidates.extend(platform_candidates)
-                    
-                    # Record query effectiveness if active learning is enabled
-                    if self.active_learning:
-                        highest_confidence = max([c.get("confidence", 0) for c in platform_candidates]) if platform_candidates else 0
-                        self.active_learning.record_query_effectiveness(
-                            platform_query, athlete_info, key, len(platform_candidates), highest_confidence
-                        )
-                    
-                    # Also extract links directly as backup
-                    links = self.extract_social_links(html, domain)
-                    for link in links:
-                        # Check if this link is already in candidates
-                        if not any(c.get("url") == link for c in all_candidates):
-                            all_candidates.append({
-                                "url": link,
-                                "platform": key,
-                                "confidence": 0.4,
-                                "reasoning": "Link extracted from platform-specific search"
-                            })
+                    seen_urls.add(phone)
+            else:
+                # Add platform information
+                for candidate in candidates:
+                    candidate["platform"] = key
                 
-                self.random_delay()
+                all_candidates.extend(candidates)
+                seen_urls.update(candidate.get("url") for candidate in candidates)
+                
+                # Record query effectiveness if active learning is enabled
+                if self.active_learning:
+                    highest_confidence = max([c.get("confidence", 0) for c in candidates]) if candidates else 0
+                    self._effectiveness_queue.put(
+                        (query, athlete_info, key, len(candidates), highest_confidence)
+                    )
+                
+                # Also extract links directly as backup
+                links = self.extract_social_links(html, domain)
+                for link in links:
+                    # Check if this link is already in candidates
+                    if link not in seen_urls:
+                        seen_urls.add(link)
+                        all_candidates.append({
+                            "url": link,
+                            "platform": key,
+                            "confidence": 0.4,
+                            "reasoning": "Link extracted from platform-specific search"
+                        })
         
         # Stage 3: Group candidates by platform
         platform_candidates = {}
@@ -641,89 +935,84 @@ class EnhancedScraperService:
         # Stage 4: Verify and select the best candidate for each platform
         verified_candidates = {}
         
+        # Take top 3 candidates per platform for verification
+        top_candidates_by_platform = {}
         for platform, candidates in platform_candidates.items():
-            # Sort by confidence
-            sorted_candidates = sorted(candidates, key=lambda x: x.get("confidence", 0), reverse=True)
-            
-            if sorted_candidates:
-                # Take top 3 candidates for verification
-                top_candidates = sorted_candidates[:3]
+            # Skip low confidence candidates
+            candidates = [c for c in candidates if c.get("confidence", 0) >= 0.4]
+            if candidates:
+                top_candidates_by_platform[platform] = heapq.nlargest(3, candidates, key=lambda x: x.get("confidence", 0))
+        
+        # Text-verify every candidate first with a single batched request, skipping profiles already rejected for this athlete
+        pending = [
+            (platform, candidate.get("url"), {platform: candidate.get("url")}, candidate.get("confidence", 0))
+            for platform, top_candidates in top_candidates_by_platform.items()
+            for candidate in top_candidates
+            if not self._is_known_mismatch(candidate.get("url"), athlete_info)
+        ]
+        verifications = self.ai_verifier.verify_profile_matches_batch(athlete_info, pending) if pending else []
+        
+        # Only social media profiles the text check can't settle are worth a screenshot
+        gray_zone_urls = {}  # platform -> [url]
+        if self.vision_enabled:
+            for (platform, url, _, _), (_, text_confidence, _) in zip(pending, verifications):
+                if (platform in platforms.values()
+                        and self.vision_min_confidence <= text_confidence <= self.vision_max_confidence
+                        and self._is_social_media_url(url)):
+                    gray_zone_urls.setdefault(platform, []).append(url)
+        
+        # Capture every uncached gray-zone profile up front, in parallel when a screenshot pool is configured
+        social_urls = [
+            url
+            for urls in gray_zone_urls.values()
+            for url in urls
+            if self._get_cached_vision(url, athlete_info) is None
+        ]
+        if self.screenshot_workers > 1:
+            screenshots = self._capture_profile_screenshots(social_urls, athlete_info)
+        else:
+            screenshots = {url: self._capture_profile_screenshot(url, athlete_info) for url in social_urls}
+        
+        # Vision-verify each platform's profiles concurrently; no browser is touched past this point
+        vision_verifications = {}  # url -> (is_match, confidence, reasoning)
+        if gray_zone_urls:
+            with ThreadPoolExecutor(max_workers=self.ai_verifier.max_concurrent_requests) as executor:
+                vision_results = {}
+                for platform_results in executor.map(
+                    lambda urls: self._vision_verify_urls(urls, athlete_info, screenshots),
+                    gray_zone_urls.values()
+                ):
+                    vision_results.update(platform_results)
                 
-                for candidate in top_candidates:
-                    url = candidate.get("url")
-                    initial_confidence = candidate.get("confidence", 0)
-                    
-                    # Skip low confidence candidates
-                    if initial_confidence < 0.4:
-                        continue
-                    
-                    # For social media platforms, try to capture screenshot and verify with vision if enabled
-                    if platform in platforms.values() and self._is_social_media_url(url) and self.vision_enabled:
-                        try:
-                            # Capture screenshot for vision verification
-                            screenshot_path = self._capture_profile_screenshot(url, athlete_info)
-                            
-                            if screenshot_path:
-                                # Verify with vision
-                                vision_match, vision_confidence, vision_reasoning = self._verify_with_vision(
-                                    screenshot_path, athlete_info
-                                )
-                                
-                                # Create profile data for AI verification
-                                profile_data = {
-                                    platform: url,
-                                    "screenshot_analysis": vision_reasoning
-                                }
-                                
-                                # Verify with AI
-                                is_match, verified_confidence, reasoning = self.ai_verifier.verify_profile_match(
-                                    athlete_info, profile_data, vision_confidence
-                                )
-                                
-                                # Store verification result
-                                verified_candidates[platform] = {
-                                    "url": url,
-                                    "confidence": verified_confidence,
-                                    "reasoning": reasoning,
-                                    "vision_verified": True
-                                }
-                                
-                                # If high confidence, break early
-                                if verified_confidence > 0.8:
-                                    break
-                            else:
-                                # Fall back to text-only verification
-                                profile_data = {platform: url}
-                                is_match, verified_confidence, reasoning = self.ai_verifier.verify_profile_match(
-                                    athlete_info, profile_data, initial_confidence
-                                )
-                                
-                                # Store verification result if better than existing
-                                if platform not in verified_candidates or verified_confidence > verified_candidates[platform]["confidence"]:
-                                    verified_candidates[platform] = {
-                                        "url": url,
-                                        "confidence": verified_confidence,
-                                        "reasoning": reasoning,
-                                        "vision_verified": False
-                                    }
-                        except Exception as e:
-                            self.logger.warning(f"Error verifying {platform} profile {url}: {str(e)}")
-                            # Continue to next candidate
-                    else:
-                        # For email and phone, use text-only verification
-                        profile_data = {platform: url}
-                        is_match, verified_confidence, reasoning = self.ai_verifier.verify_profile_match(
-                            athlete_info, profile_data, initial_confidence
-                        )
-                        
-                        # Store verification result if better than existing
-                        if platform not in verified_candidates or verified_confidence > verified_candidates[platform]["confidence"]:
-                            verified_candidates[platform] = {
-                                "url": url,
-                                "confidence": verified_confidence,
-                                "reasoning": reasoning,
-                                "vision_verified": False
-                            }
+                # Re-verify gray-zone profiles with what their screenshots show
+                jobs = [
+                    (platform, url, vision_results[url])
+                    for platform, urls in gray_zone_urls.items()
+                    for url in urls
+                    if vision_results.get(url)
+                ]
+                for (_, url, _), verification in zip(jobs, executor.map(
+                    lambda job: self._verify_with_screenshot_analysis(athlete_info, *job), jobs
+                )):
+                    if verification:
+                        vision_verifications[url] = verification
+        
+        for (platform, url, _, _), text_verification in zip(pending, verifications):
+            vision_verified = url in vision_verifications
+            is_match, verified_confidence, reasoning = vision_verifications[url] if vision_verified else text_verification
+            
+            # Remember clear rejections so this profile is never re-verified for this athlete
+            if not is_match and 0 < verified_confidence < self.mismatch_threshold:
+                self._record_mismatch(url, athlete_info)
+            
+            # Store verification result if better than existing
+            if platform not in verified_candidates or verified_confidence > verified_candidates[platform]["confidence"]:
+                verified_candidates[platform] = {
+                    "url": url,
+                    "confidence": verified_confidence,
+                    "reasoning": reasoning,
+                    "vision_verified": vision_verified
+                }
         
         # Stage 5: Final synthesis and decision with lower thresholds to ensure more links
         for platform, verification in verified_candidates.items():
@@ -790,16 +1079,14 @@ class EnhancedScraperService:
         # This is a fallback to ensure we always return something
         for platform, candidates in platform_candidates.items():
             if result[platform] is None and candidates:
-                # Sort by confidence
-                sorted_candidates = sorted(candidates, key=lambda x: x.get("confidence", 0), reverse=True)
-                if sorted_candidates:
-                    best_candidate = sorted_candidates[0]
-                    url = best_candidate.get("url")
-                    confidence = best_candidate.get("confidence", 0)
-                    
-                    if url:
-                        result[platform] = url
-                        self.logger.info(f"Fallback match for {platform}: {url} ({confidence:.2f})")
+                # Take the highest confidence candidate
+                best_candidate = max(candidates, key=lambda x: x.get("confidence", 0))
+                url = best_candidate.get("url")
+                confidence = best_candidate.get("confidence", 0)
+                
+                if url:
+                    result[platform] = url
+                    self.logger.info(f"Fallback match for {platform}: {url} ({confidence:.2f})")
         
         # Log results
         found_items = {k: v for k, v in result.items() if v is not None}
@@ -822,40 +1109,44 @@ class EnhancedScraperService:
         }
         
         context_keywords = ["athlete", "college", "sports"]  # Simplified, broader keywords
-        name_parts = [first_name.lower(), last_name.lower()]
+        name_parts = {first_name.lower(), last_name.lower()}
+        
+        # Pick two distinct keywords once per athlete so no query is ever issued twice
+        query_keywords = random.sample(context_keywords, 2)
 
         # Social media searches with flexible, broader queries
         for domain, key in platforms.items():
-            search_queries = [
-                f"{full_name} {random.choice(context_keywords)} site:{domain}",  # No quotes
-                f"{first_name} {last_name} {random.choice(context_keywords)} site:{domain}",  # No quotes
-            ]
+            search_queries = [f"{full_name} {keyword} site:{domain}" for keyword in query_keywords]  # No quotes
             for query in search_queries:
-                html = self.search_platform(query, domain)
-                if html:
-                    links = self.extract_social_links(html, domain)
+                links, searched = self._search_and_extract(
+                    query, domain, lambda html: self.extract_social_links(html, domain)
+                )
+                if links is not None:
+                    # Extracted links and emails are already lowercase
                     for link in links:
-                        if any(part in link.lower() for part in name_parts):
+                        if any(part in link for part in name_parts):
                             result[key] = link
                             break
                     if not result[key] and links:
                         result[key] = links[0]
                     if result[key]:
                         break
-                self.random_delay()
+                if searched:
+                    self.random_delay()
 
         # Contact info searches with broader queries
         contact_queries = [
-            f"{full_name} {random.choice(context_keywords)} contact email phone",  # No quotes
+            f"{full_name} {query_keywords[0]} contact email phone",  # No quotes
             f"{first_name} {last_name} contact email",  # No quotes
         ]
         for query in contact_queries:
-            html = self.search_platform(query, "")
-            if html:
-                emails = self.extract_emails(html)
-                phones = self.extract_phones(html)
+            contacts, searched = self._search_and_extract(
+                query, "", lambda html: (self.extract_emails(html), self.extract_phones(html))
+            )
+            if contacts is not None:
+                emails, phones = contacts
                 for email in emails:
-                    if any(part in email.lower() for part in name_parts) or any(kw in email.lower() for kw in ['edu', 'athletics']):
+                    if any(part in email for part in name_parts) or 'edu' in email or 'athletics' in email:
                         result["email"] = email
                         break
                 if not result["email"] and emails:
@@ -864,14 +1155,15 @@ class EnhancedScraperService:
                     result["phone"] = phones[0]
                 if result["email"] or result["phone"]:
                     break
-            self.random_delay()
+            if searched:
+                self.random_delay()
 
         found_items = {k: v for k, v in result.items() if v is not None}
         if found_items:
             self.success_logger.info(f"Found for {full_name}: {found_items}")
         return result
     
-    def _verify_with_vision(self, screenshot_path: str, athlete_info: Dict[str, Any]) -> Tuple[bool, float, str]:
+    def _verify_with_vision(self, screenshot: str, athlete_info: Dict[str, Any]) -> Tuple[bool, float, str]:
         """Verify a profile screenshot using vision capabilities."""
         if not self.ai_verifier:
             return False, 0.0, "AI verifier not available"
@@ -881,10 +1173,6 @@ class EnhancedScraperService:
             return False, 0.0, "Vision verification not enabled"
         
         try:
-            # Read the screenshot file
-            with open(screenshot_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-            
             # Create a prompt for vision analysis
             full_name = f"{athlete_info.get('First_Name', '')} {athlete_info.get('Last_Name', '')}"
             prompt = f"""
@@ -912,7 +1200,7 @@ class EnhancedScraperService:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{base64_image}",
+                                    "url": screenshot,
                                     "detail": "high"
                                 }
                             }
@@ -929,40 +1217,20 @@ class EnhancedScraperService:
             is_match = False
             confidence = 0.5  # Default confidence
             
-            # Check for positive indicators
-            positive_indicators = [
-                "appears to be the correct athlete",
-                "likely belongs to",
-                "high confidence this is",
-                "strong evidence this is",
-                "profile matches",
-                "confirmed match"
-            ]
-            
-            # Check for negative indicators
-            negative_indicators = [
-                "does not appear to be",
-                "unlikely to be",
-                "no evidence this is",
-                "cannot confirm this is",
-                "different person",
-                "not a match"
-            ]
-            
             # Determine match based on indicators
-            if any(indicator in vision_analysis.lower() for indicator in positive_indicators):
+            if _VISION_POSITIVE_RE.search(vision_analysis):
                 is_match = True
                 confidence = 0.7  # Start with moderate confidence
                 
                 # Increase confidence for stronger matches
-                if "confirmed match" in vision_analysis.lower() or "strong evidence" in vision_analysis.lower():
+                if _VISION_STRONG_POSITIVE_RE.search(vision_analysis):
                     confidence = 0.85
-            elif any(indicator in vision_analysis.lower() for indicator in negative_indicators):
+            elif _VISION_NEGATIVE_RE.search(vision_analysis):
                 is_match = False
                 confidence = 0.2  # Low confidence in non-match
                 
                 # Decrease confidence for stronger non-matches
-                if "definitely not" in vision_analysis.lower() or "clearly not" in vision_analysis.lower():
+                if _VISION_STRONG_NEGATIVE_RE.search(vision_analysis):
                     confidence = 0.1
             
             # Return the results
@@ -972,36 +1240,318 @@ class EnhancedScraperService:
             self.logger.error(f"Error in vision verification: {str(e)}")
             return False, 0.0, f"Vision verification error: {str(e)}"
     
+    def _vision_verify_urls(self, urls: List[str], athlete_info: Dict[str, Any], screenshots: Dict[str, Optional[Future]]) -> Dict[str, Tuple[bool, float, str]]:
+        """Vision-verify captured profile URLs, using cached results and one multi-image request for the rest."""
+        vision_results = {}
+        to_verify = {}  # url -> screenshot future, then image data URL
+        for url in urls:
+            # Reuse an earlier vision verification of this URL for this athlete
+            cached = self._get_cached_vision(url, athlete_info)
+            if cached is not None:
+                vision_results[url] = cached
+                continue
+            
+            # Screenshots are captured up front by the caller
+            screenshot = screenshots.get(url)
+            if screenshot:
+                to_verify[url] = screenshot
+        
+        # Wait for the screenshot writes only once every page has been captured
+        to_verify = {url: screenshot.result() for url, screenshot in to_verify.items()}
+        to_verify = {url: image for url, image in to_verify.items() if image}
+        
+        if to_verify:
+            batch_results = self._verify_with_vision_batch(list(to_verify.values()), athlete_info)
+            for url, vision_result in zip(to_verify, batch_results):
+                self._store_cached_vision(url, athlete_info, vision_result)
+                vision_results[url] = vision_result
+        
+        return vision_results
+    
+    def _verify_with_screenshot_analysis(self, athlete_info: Dict[str, Any], platform: str, url: str,
+                                         vision_result: Tuple[bool, float, str]) -> Optional[Tuple[bool, float, str]]:
+        """Run AI profile verification informed by a vision analysis of the profile screenshot."""
+        try:
+            vision_match, vision_confidence, vision_reasoning = vision_result
+            
+            # Create profile data for AI verification
+            profile_data = {
+                platform: url,
+                "screenshot_analysis": vision_reasoning
+            }
+            
+            # Verify with AI
+            return self.ai_verifier.verify_profile_match(athlete_info, profile_data, vision_confidence)
+        except Exception as e:
+            self.logger.warning(f"Error verifying {platform} profile {url}: {str(e)}")
+            return None
+    
+    def _verify_with_vision_batch(self, screenshots: List[str], athlete_info: Dict[str, Any]) -> List[Tuple[bool, float, str]]:
+        """Verify several profile screenshots for one athlete, sending up to max_vision_images per request."""
+        results = []
+        for start in range(0, len(screenshots), self.max_vision_images):
+            chunk = screenshots[start:start + self.max_vision_images]
+            
+            # A single screenshot gets the detailed single-image analysis
+            if len(chunk) == 1:
+                results.append(self._verify_with_vision(chunk[0], athlete_info))
+                continue
+            
+            chunk_results = self._verify_vision_images(chunk, athlete_info)
+            
+            # Fall back to single-image verification for any screenshot the model skipped
+            for screenshot, result in zip(chunk, chunk_results):
+                results.append(result if result else self._verify_with_vision(screenshot, athlete_info))
+        
+        return results
+    
+    def _verify_vision_images(self, screenshots: List[str], athlete_info: Dict[str, Any]) -> List[Optional[Tuple[bool, float, str]]]:
+        """Ask the vision model to judge several numbered screenshots in a single request."""
+        results: List[Optional[Tuple[bool, float, str]]] = [None] * len(screenshots)
+        
+        if not self.ai_verifier:
+            return [(False, 0.0, "AI verifier not available")] * len(screenshots)
+        
+        # Check if vision is enabled
+        if not self.vision_enabled:
+            return [(False, 0.0, "Vision verification not enabled")] * len(screenshots)
+        
+        try:
+            full_name = f"{athlete_info.get('First_Name', '')} {athlete_info.get('Last_Name', '')}"
+            prompt = f"""
+            The following {len(screenshots)} images are social media profile screenshots, numbered 1 to {len(screenshots)} in order.
+            For each one, determine if it belongs to NCAA football player {full_name}.
+            
+            Look for:
+            1. Name matches or similarities
+            2. References to football, NCAA, college athletics
+            3. School/university mentions matching {athlete_info.get('School', 'Unknown')}
+            4. Photos of the athlete in uniform or at athletic events
+            5. Bio information related to football or athletics
+            6. Mentions of position {athlete_info.get('Position', 'Unknown')} or jersey number
+            
+            Judge each image independently; several may belong to the athlete.
+            
+            Provide your response as JSON with this structure:
+            {{
+                "results": [
+                    {{
+                        "image": 1,
+                        "is_match": true/false,
+                        "confidence": 0-100,
+                        "reasoning": "what you see in the image and why it is or isn't the athlete"
+                    }},
+                    ...
+                ]
+            }}
+            """
+            
+            content = [{"type": "text", "text": prompt}]
+            for screenshot in screenshots:
+                content.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": screenshot,
+                        "detail": "high"
+                    }
+                })
+            
+            completion_params = {
+                "model": self.vision_model,
+                "messages": [{"role": "user", "content": content}],
+                "max_tokens": 500 * len(screenshots)
+            }
+            
+            # Only add response_format if not using o1-preview
+            if not self.vision_model.startswith("o1-"):
+                completion_params["response_format"] = {"type": "json_object"}
+            
+            try:
+                response = self.ai_verifier.client.chat.completions.create(**completion_params)
+            except Exception as e:
+                # The vision model is configurable and may not support JSON mode; ask once more without it
+                if "response_format" not in completion_params or "response_format" not in str(e):
+                    raise
+                self.logger.info(f"{self.vision_model} rejected JSON mode, retrying with a plain prompt")
+                del completion_params["response_format"]
+                response = self.ai_verifier.client.chat.completions.create(**completion_params)
+            
+            # Without JSON mode the object may come wrapped in prose or a code fence
+            text = response.choices[0].message.content
+            response_data = json.loads(text[text.find("{"):text.rfind("}") + 1])
+            
+            for entry in response_data.get("results", []):
+                number = entry.get("image")
+                if not isinstance(number, int) or not 1 <= number <= len(screenshots):
+                    continue
+                results[number - 1] = (
+                    bool(entry.get("is_match", False)),
+                    entry.get("confidence", 50) / 100.0,  # Convert from percentage
+                    entry.get("reasoning", "No detailed reasoning provided")
+                )
+        except Exception as e:
+            self.logger.error(f"Error in batch vision verification: {str(e)}")
+        
+        return results
+    
+    def _athlete_key(self, athlete_info: Dict[str, Any]) -> str:
+        """Identify an athlete across runs by name and school."""
+        return f"{athlete_info.get('First_Name', '')}{athlete_info.get('Last_Name', '')}{athlete_info.get('School', '')}"
+    
+    def _vision_cache_key(self, url: str, athlete_info: Dict[str, Any]) -> str:
+        """Build the vision cache key for a profile URL and athlete."""
+        return hashlib.sha256(f"{url}|{self._athlete_key(athlete_info)}".encode('utf-8')).hexdigest()
+    
+    def _mismatch_digest(self, url: str, athlete_info: Dict[str, Any]) -> bytes:
+        """Compact 8-byte digest of a (profile URL, athlete) pair for the mismatch cache."""
+        return hashlib.blake2b(f"{url}|{self._athlete_key(athlete_info)}".encode('utf-8'), digest_size=8).digest()
+    
+    def _is_known_mismatch(self, url: str, athlete_info: Dict[str, Any]) -> bool:
+        """Check whether a profile URL was rejected for this athlete within the mismatch TTL."""
+        cached = self.known_mismatches.get(self._mismatch_digest(url, athlete_info))
+        return bool(cached) and time.time() - cached[0] < self.mismatch_cache_ttl
+    
+    def _record_mismatch(self, url: str, athlete_info: Dict[str, Any]) -> None:
+        """Remember that a profile URL does not belong to this athlete."""
+        self.known_mismatches[self._mismatch_digest(url, athlete_info)] = (time.time(), True)
+    
+    def _get_cached_vision(self, url: str, athlete_info: Dict[str, Any]) -> Optional[Tuple[bool, float, str]]:
+        """Return a cached vision result for this URL and athlete, or None if missing or expired."""
+        cached = self.vision_cache.get(self._vision_cache_key(url, athlete_info))
+        if cached and time.time() - cached[0] < self.vision_cache_ttl:
+            return cached[1]
+        return None
+    
+    def _store_cached_vision(self, url: str, athlete_info: Dict[str, Any], result: Tuple[bool, float, str]) -> None:
+        """Cache a vision result and persist the cache to disk."""
+        # Failed verifications come back with zero confidence; don't keep them
+        if result[1] <= 0:
+            return
+        
+        with self._vision_cache_lock:
+            self.vision_cache[self._vision_cache_key(url, athlete_info)] = (time.time(), result)
+            self._save_timed_cache(self.vision_cache_path, self.vision_cache)
+    
+    def _load_timed_cache(self, path: str, ttl: float) -> Dict[str, Tuple[float, Any]]:
+        """Load a persistent (timestamp, value) cache from a pickle file, dropping expired entries."""
+        if not os.path.exists(path):
+            return {}
+        
+        try:
+            with open(path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading cache {path}: {str(e)}")
+            return {}
+        
+        # Files from older versions may hold another structure; start those caches afresh
+        if not isinstance(cache, dict):
+            return {}
+        
+        now = time.time()
+        return {key: entry for key, entry in cache.items() if now - entry[0] < ttl}
+    
+    def _save_timed_cache(self, path: str, cache: Dict[str, Tuple[float, Any]]) -> None:
+        """Persist a (timestamp, value) cache to a pickle file."""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                pickle.dump(cache, f)
+        except Exception as e:
+            self.logger.error(f"Error saving cache {path}: {str(e)}")
+    
+    def _search_and_extract(self, query: str, domain: str, extract) -> Tuple[Optional[Any], bool]:
+        """
+        Run a search and extract results from the page, reusing extractions cached for the same query.
+        
+        Returns:
+            Tuple of (extracted results or None if the search failed, whether a live search was made)
+        """
+        key = f"{query}|{domain}"
+        cached = self.search_cache.get(key)
+        if cached and time.time() - cached[0] < self.search_cache_ttl:
+            return cached[1], False
+        
+        html = self.search_platform(query, domain)
+        if not html:
+            return None, True
+        
+        # Only the extracted results are kept, so the cache stays small
+        extracted = extract(html)
+        self.search_cache[key] = (time.time(), extracted)
+        return extracted, True
+    
     def _is_social_media_url(self, url: str) -> bool:
         """Check if a URL is a valid social media profile URL using enhanced validation."""
         if not url:
             return False
             
         # Check for email or phone
-        if '@' in url or url.startswith('tel:') or re.match(r'^\d{3}[-.\s]?\d{3}[-.\s]?\d{4}$', url):
+        if '@' in url or url.startswith('tel:') or _BARE_PHONE_RE.match(url):
             return False
         
         # Determine platform from URL
-        platform = ''
-        if 'twitter.com' in url.lower():
-            platform = 'twitter'
-        elif 'facebook.com' in url.lower():
-            platform = 'facebook'
-        elif 'instagram.com' in url.lower():
-            platform = 'instagram'
-        else:
+        platform = _platform_from_url(url)
+        if not platform:
             return False
             
         # Use URL validator to validate the URL
-        validated_url = self.url_validator.clean_and_validate_url(url, platform)
+        validated_url = _validate_profile_url(self.url_validator, url, platform)
         
         # If URL validator returns a valid URL, it's a social media profile URL
         return validated_url is not None
     
-    def _capture_profile_screenshot(self, url: str, athlete_info: Dict[str, Any]) -> Optional[str]:
-        """Capture a screenshot of a social media profile for vision verification."""
+    def _capture_profile_screenshots(self, urls: List[str], athlete_info: Dict[str, Any]) -> Dict[str, Optional[Future]]:
+        """Capture screenshots of several profiles in parallel, each platform with its own driver pool."""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        
+        # Split the browser budget across the platforms present so each one advances independently:
+        # every platform gets one browser and the rest are handed out in turn
+        platforms = sorted({_platform_from_url(url) for url in urls})
+        spare = max(0, self.screenshot_workers - len(platforms))
+        for index, platform in enumerate(platforms):
+            if platform not in self.driver_pools:
+                pool_size = 1 + spare // len(platforms) + (1 if index < spare % len(platforms) else 0)
+                self.driver_pools[platform] = DriverPool(
+                    pool_size,
+                    lambda: setup_chrome_driver(enable_cookies=False, headless=True),
+                    self.logger
+                )
+        
+        def capture(url):
+            with self.driver_pools[_platform_from_url(url)].driver() as driver:
+                return self._capture_profile_screenshot(url, athlete_info, driver)
+        
+        max_workers = min(sum(self.driver_pools[platform].size for platform in platforms), len(urls))
+        self.logger.info(f"Capturing {len(urls)} profile screenshots with up to {max_workers} browsers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(urls, executor.map(capture, urls)))
+    
+    def _rate_limiter(self, platform: str) -> TokenBucket:
+        """Return the token bucket pacing page loads on a platform."""
+        with self._rate_limiters_lock:
+            if platform not in self.rate_limiters:
+                self.rate_limiters[platform] = TokenBucket(self.platform_rate, self.platform_burst)
+            return self.rate_limiters[platform]
+    
+    def _capture_profile_screenshot(self, url: str, athlete_info: Dict[str, Any], driver=None) -> Optional[Future]:
+        """Capture a screenshot of a social media profile; the returned future resolves to an image data URL."""
         if not url or not self._is_social_media_url(url):
             return None
+        
+        # Reuse a recent screenshot of the same page
+        with self._screenshot_cache_lock:
+            cached = self._screenshot_cache.get(url)
+        if cached and time.monotonic() - cached[0] < self.screenshot_cache_ttl:
+            future = cached[1]
+            if not future.done() or future.result():
+                self.logger.info(f"Using cached screenshot of {url}")
+                return future
+        
+        # Use the main driver unless a pooled one is provided
+        driver = driver or self.driver
             
         try:
             # Generate a unique filename
@@ -1010,25 +1560,37 @@ class EnhancedScraperService:
             filename = f"{athlete_info.get('First_Name', 'unknown')}_{athlete_info.get('Last_Name', 'unknown')}_{timestamp}_{random_str}.png"
             screenshot_path = os.path.join(self.screenshot_dir, filename)
             
-            # Navigate to the URL
+            # Navigate to the URL, at the platform's allowed pace
+            platform = _platform_from_url(url)
+            self._rate_limiter(platform).acquire()
             self.logger.info(f"Capturing screenshot of {url}")
-            self.driver.get(url)
+            driver.get(url)
+            config = _PLATFORM_CONFIG[platform]
             
-            # Wait for page to load
+            # Wait for the profile content itself rather than just the document body
             try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, config['wait_selector']))
                 )
                 
                 # Scroll down slightly to show more content
-                self.driver.execute_script("window.scrollBy(0, 300)")
-                time.sleep(1)
+                driver.execute_script(f"window.scrollBy(0, {config['scroll']})")
+                
+                # Pages load eagerly, so let the profile photos finish loading before capturing;
+                # vision verification depends on them. Capture whatever is there after the timeout.
+                try:
+                    WebDriverWait(driver, _IMAGES_LOADED_TIMEOUT).until(
+                        lambda d: d.execute_script(_IMAGES_LOADED_SCRIPT, config['wait_selector'])
+                    )
+                except TimeoutException:
+                    self.logger.debug(f"Images still loading on {url}, capturing anyway")
                 
-                # Take screenshot
-                self.driver.save_screenshot(screenshot_path)
-                self.logger.info(f"Screenshot saved to {screenshot_path}")
+                # Take screenshot; encoding and writing happen on the I/O pool so the driver can move on
+                png = driver.get_screenshot_as_png()
+                future = self._io_pool.submit(self._encode_screenshot, png, screenshot_path)
+                self._cache_screenshot(url, future)
                 
-                return screenshot_path
+                return future
             except TimeoutException:
                 self.logger.warning(f"Timeout waiting for page to load: {url}")
                 return None
@@ -1037,28 +1599,93 @@ class EnhancedScraperService:
             self.logger.error(f"Error capturing screenshot: {str(e)}")
             return None
     
+    def _cache_screenshot(self, url: str, future: Future) -> None:
+        """Remember a screenshot by URL, dropping expired entries so image data doesn't pile up."""
+        now = time.monotonic()
+        # Capture workers share the cache, so prune and insert in place under the lock
+        with self._screenshot_cache_lock:
+            expired = [
+                cached_url for cached_url, entry in self._screenshot_cache.items()
+                if now - entry[0] >= self.screenshot_cache_ttl
+            ]
+            for cached_url in expired:
+                del self._screenshot_cache[cached_url]
+            self._screenshot_cache[url] = (now, future)
+    
+    def _encode_screenshot(self, png: bytes, png_path: str) -> str:
+        """Downscale PNG screenshot bytes to JPEG and return them as a data URL, saving to disk if enabled."""
+        try:
+            with Image.open(io.BytesIO(png)) as image:
+                image = image.convert("RGB")
+                if image.width > _SCREENSHOT_MAX_WIDTH:
+                    height = int(image.height * _SCREENSHOT_MAX_WIDTH / image.width)
+                    image = image.resize((_SCREENSHOT_MAX_WIDTH, height), Image.LANCZOS)
+                buffer = io.BytesIO()
+                image.save(buffer, "JPEG", quality=_SCREENSHOT_JPEG_QUALITY, optimize=True)
+            image_bytes, mime_type, path = buffer.getvalue(), "image/jpeg", os.path.splitext(png_path)[0] + ".jpg"
+        except Exception as e:
+            self.logger.warning(f"Could not compress screenshot, using PNG instead: {str(e)}")
+            image_bytes, mime_type, path = png, "image/png", png_path
+        
+        # Keep a copy on disk for debugging only when asked to
+        if self.persist_screenshots:
+            try:
+                with open(path, "wb") as f:
+                    f.write(image_bytes)
+                self.logger.info(f"Screenshot saved to {path}")
+            except Exception as e:
+                self.logger.error(f"Error saving screenshot: {str(e)}")
+        
+        return f"data:{mime_type};base64,{base64.b64encode(image_bytes).decode('utf-8')}"
+    
+    def _extract_contacts(self, html: str) -> Tuple[List[str], List[str]]:
+        """
+        Extract emails and phone numbers in one pass over the HTML.
+        
+        Args:
+            html: Raw page HTML
+            
+        Returns:
+            Tuple of (emails, phones)
+        """
+        if not html:
+            return [], []
+        
+        emails, phones = [], []
+        seen_emails, seen_phones = set(), set()
+        
+        for match in _CONTACT_RE.finditer(html):
+            kind = match.lastgroup
+            value = match.group(kind)
+            
+            if kind == "email":
+                email = value.lower()
+                if email not in seen_emails and self.is_valid_email(value):
+                    seen_emails.add(email)
+                    emails.append(email)
+            else:
+                phone = self._format_phone(value)
+                if phone and phone not in seen_phones:
+                    seen_phones.add(phone)
+                    phones.append(phone)
+        
+        return emails, phones
+    
     def extract_social_links(self, html: str, domain: str) -> List[str]:
         """Extract and clean social media URLs using enhanced validation."""
         if not html:
             return []
             
-        soup = BeautifulSoup(html, 'html.parser')
         raw_links = []
         
-        # Extract all links from the HTML
-        for a in soup.find_all("a", href=True):
-            href = a["href"].lower()
+        # Extract all links from the HTML; only the href values are needed, so skip building a DOM
+        for match in _HREF_RE.finditer(html):
+            href = match.group(1).lower()
             if domain in href:
-                raw_links.append(href)
+                raw_links.append(href.replace('&amp;', '&'))
         
         # Determine platform from domain
-        platform = ''
-        if 'twitter.com' in domain:
-            platform = 'twitter'
-        elif 'facebook.com' in domain:
-            platform = 'facebook'
-        elif 'instagram.com' in domain:
-            platform = 'instagram'
+        platform = _platform_from_url(domain) or ''
         
         # Use URL validator to filter and clean links
         valid_links = self.url_validator.filter_social_links(raw_links, platform)
@@ -1069,13 +1696,7 @@ class EnhancedScraperService:
     def clean_social_url(self, url: str, platform: str) -> Optional[str]:
         """Clean and validate a social media URL using enhanced validation."""
         # Determine platform string from domain
-        platform_key = ''
-        if 'twitter.com' in platform:
-            platform_key = 'twitter'
-        elif 'facebook.com' in platform:
-            platform_key = 'facebook'
-        elif 'instagram.com' in platform:
-            platform_key = 'instagram'
+        platform_key = _platform_from_url(platform) or ''
         
         # Use URL validator to clean and validate the URL
         return self.url_validator.clean_and_validate_url(url, platform_key)
@@ -1085,28 +1706,28 @@ class EnhancedScraperService:
         if not html:
             return []
             
-        # Use a comprehensive regex for email extraction
-        email_pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-        emails = email_pattern.findall(html)
-        
-        # Filter and validate emails
+        # Filter, validate and deduplicate emails as they are found
+        seen = set()
         valid_emails = []
-        for email in set(emails):
+        for match in _EMAIL_RE.finditer(html):
+            email = match.group(0).lower()
+            if email in seen:
+                continue
+            seen.add(email)
             if self.is_valid_email(email):
-                valid_emails.append(email.lower())
+                valid_emails.append(email)
                 
         return valid_emails
     
     def is_valid_email(self, email: str) -> bool:
         """Perform basic email validation."""
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _BASIC_EMAIL_RE.match(email):
             return False
             
         # Check for disposable email domains
-        disposable_domains = ['tempmail', 'throwaway', 'temporary', 'mailinator', 'guerrillamail']
-        domain = email.split('@')[1].lower()
+        domain = email.rpartition('@')[2].lower()
         
-        if any(x in domain for x in disposable_domains):
+        if _DISPOSABLE_RE.search(domain):
             return False
             
         # Prioritize .edu emails
@@ -1114,8 +1735,7 @@ class EnhancedScraperService:
             return True
             
         # Check for common email providers
-        common_providers = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'aol.com']
-        if domain in common_providers:
+        if domain in _COMMON_PROVIDERS:
             return True
             
         # Additional validation for other domains
@@ -1126,46 +1746,38 @@ class EnhancedScraperService:
         if not html:
             return []
             
-        # Use a comprehensive regex for phone extraction
-        phone_pattern = re.compile(r"""
-            (?:\+?1[-.\s]?)?          # Optional country code
-            (?:\s*\(?\d{3}\)?[-.\s]?)  # Area code
-            \d{3}[-.\s]?            # First 3 digits
-            \d{4}                   # Last 4 digits
-            """, re.VERBOSE)
-            
-        phones = phone_pattern.findall(html)
-        
-        # Clean and format phone numbers
+        # Clean and format phone numbers, deduplicating on the formatted number
+        seen = set()
         cleaned_phones = []
-        for phone in set(phones):
-            # Extract only digits
-            digits = re.sub(r'\D', '', phone)
-            
-            # Format 10-digit numbers
-            if len(digits) == 10:
-                formatted = f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                cleaned_phones.append(formatted)
-            # Format 11-digit numbers starting with 1 (US country code)
-            elif len(digits) == 11 and digits.startswith('1'):
-                formatted = f"({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
+        for match in _PHONE_RE.finditer(html):
+            formatted = self._format_phone(match.group(0))
+            if formatted and formatted not in seen:
+                seen.add(formatted)
                 cleaned_phones.append(formatted)
                 
         return cleaned_phones
     
+    def _format_phone(self, phone: str) -> Optional[str]:
+        """Format a raw phone match as (XXX) XXX-XXXX, or None if it is not a US number."""
+        # Extract only digits
+        digits = _NONDIGIT_RE.sub('', phone)
+        
+        # Format 10-digit numbers
+        if len(digits) == 10:
+            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+        # Format 11-digit numbers starting with 1 (US country code)
+        elif len(digits) == 11 and digits.startswith('1'):
+            return f"({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
+        
+        return None
+    
     def fetch_profile_content(self, url: str) -> str:
         """Fetch the content of a profile page."""
         self.logger.info(f"Fetching profile content: {url}")
         
         try:
             # Determine platform from URL
-            platform = None
-            if 'twitter.com' in url.lower():
-                platform = 'twitter'
-            elif 'facebook.com' in url.lower():
-                platform = 'facebook'
-            elif 'instagram.com' in url.lower():
-                platform = 'instagram'
+            platform = _platform_from_url(url)
             
             # Navigate to the URL
             self.driver.get(url)
@@ -1179,15 +1791,21 @@ class EnhancedScraperService:
                 if not self.verify_login_during_scraping(platform):
                     self.logger.warning(f"Could not verify login for {platform}, content may be limited")
             
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Wait for the profile content itself rather than just the document body
+            config = _PLATFORM_CONFIG.get(platform, _DEFAULT_PAGE_CONFIG)
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, config['wait_selector']))
+                )
+            except TimeoutException:
+                # Login walls, consent walls and missing-account pages never render the profile
+                # container; their text is still worth analyzing
+                self.logger.debug(f"Profile content not found on {url}, using the page as loaded")
             
             # Simulate human behavior
-            self.driver.execute_script("window.scrollBy(0, 300)")
+            self.driver.execute_script(f"window.scrollBy(0, {config['scroll']})")
             time.sleep(1)
-            self.driver.execute_script("window.scrollBy(0, 300)")
+            self.driver.execute_script(f"window.scrollBy(0, {config['scroll']})")
             time.sleep(1)
             
             # Get page source
@@ -3,33 +3,231 @@ import random
 import urllib.parse
 import re
 import json
-from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Optional, List, Tuple, Any
+from utils.html_cache import HTMLCache
+# Selenium is imported inside the browser-only methods, so HTTP-only use never loads it
+
+# Headers for plain HTTP requests; the User-Agent and client hints are rotated per search
+_SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Chrome builds to impersonate for direct search fetches, with matching client hints
+_UA_PLATFORMS = {
+    'Windows': 'Windows NT 10.0; Win64; x64',
+    'macOS': 'Macintosh; Intel Mac OS X 10_15_7',
+    'Linux': 'X11; Linux x86_64'
+}
+_SEARCH_HEADER_ROTATION = [
+    {
+        'User-Agent': f'Mozilla/5.0 ({os_string}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version}.0.0.0 Safari/537.36',
+        'sec-ch-ua': f'"Chromium";v="{version}", "Google Chrome";v="{version}", "Not-A.Brand";v="99"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': f'"{platform_name}"'
+    }
+    for version in range(117, 124)
+    for platform_name, os_string in _UA_PLATFORMS.items()
+]
+
+# Markup present only when a search page actually contains results (Bing, DuckDuckGo)
+_RESULT_MARKER_RE = re.compile(r'class="b_algo"|data-testid="result"|class="result__a"')
+# Bot checks and script-required interstitials that only a real browser can get past
+_CHALLENGE_RE = re.compile(r'/sorry/|enable javascript|b_captcha|anomaly-modal', re.IGNORECASE)
+
+# Anti-detection overrides, installed once per browser to run before every page's own scripts
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+    Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
+"""
+
+# Where the organic results start on a search page (Bing, DuckDuckGo) and where they end
+_RESULTS_START_MARKERS = ('id="b_results"', 'id="links"')
+_RESULTS_END_MARKERS = ('id="b_context"', '<footer')
+_MAX_RESULTS_CHARS = 200_000  # Cap on the results section handed to the AI and contact extractors
+_MAX_LINK_SCAN_CHARS = 500_000  # Cap on the full page scanned for social links (ads included)
+
+# Page readiness probes
+_READY_SCRIPT = "return document.readyState === 'complete'"
+_RESOURCE_COUNT_SCRIPT = "return performance.getEntriesByType('resource').length"
+
+# Contact detail patterns, compiled once
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+# Each optional group is followed by a fixed digit run, so the pattern cannot backtrack heavily
+_PHONE_RE = re.compile(r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b', re.ASCII)
+_BASIC_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_DISPOSABLE_RE = re.compile(r"tempmail|throwaway|temporary")
+# Translation table deleting every non-digit character (phone matches are ASCII-only)
+_DIGIT_KEEP = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+# Quoted href attribute values in raw HTML
+_HREF_RE = re.compile(r"""href\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+# Social profile links, emails and phone numbers in one pass; the matching group names the kind
+_SOCIAL_DOMAINS = ('twitter.com', 'facebook.com', 'instagram.com')
+_CONTACT_RE = re.compile(
+    r"""(?i:href\s*=\s*["'](?P<social>[^"']*(?:twitter|facebook|instagram)\.com[^"']*)["'])"""
+    rf"|(?P<email>{_EMAIL_RE.pattern})|(?P<phone>{_PHONE_RE.pattern})",
+    re.ASCII
+)
+
+# Username captured from a profile URL on each platform
+_USERNAME_RES = {
+    'twitter.com': re.compile(r'twitter\.com/([^/]+)'),
+    'facebook.com': re.compile(r'facebook\.com/([^/]+)'),
+    'instagram.com': re.compile(r'instagram\.com/([^/]+)')
+}
+
+# Sites whose pages are client-rendered; plain HTTP only gets an app shell or login wall
+_JS_RENDERED_DOMAINS = _SOCIAL_DOMAINS + ('x.com',)
+
+def _is_valid_email_fast(email: str) -> bool:
+    """Validate an address already matched by _EMAIL_RE, which guarantees its basic shape."""
+    return not _DISPOSABLE_RE.search(email.rpartition('@')[2].lower())
+
+def _format_phone(digits: str) -> Optional[str]:
+    """Format a US number's digits as (XXX) XXX-XXXX, or return None if it isn't one."""
+    if len(digits) == 11 and digits.startswith('1'):
+        digits = digits[1:]
+    if len(digits) != 10:
+        return None
+    return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+
+def _is_js_rendered(url: str) -> bool:
+    """Check whether a URL is on a site (or subdomain) that renders its pages only with JavaScript."""
+    # Scheme-less URLs need a leading // for urlsplit to find the host
+    host = (urllib.parse.urlsplit(url if '//' in url else '//' + url).hostname or '').lower()
+    return any(host == domain or host.endswith('.' + domain) for domain in _JS_RENDERED_DOMAINS)
+
+def _canonical_query(query: str) -> str:
+    """Normalize a search query for duplicate detection: lowercase, single spaces, site: filters last and sorted."""
+    tokens = query.lower().split()
+    sites = sorted(token for token in tokens if token.startswith('site:'))
+    return ' '.join([token for token in tokens if not token.startswith('site:')] + sites)
+
+def _slice_results(html: str) -> str:
+    """Cut a search page down to its results section with plain string searches, without parsing it."""
+    for marker in _RESULTS_START_MARKERS:
+        start = html.find(marker)
+        if start != -1:
+            break
+    else:
+        return html[:_MAX_RESULTS_CHARS]
+    
+    # Back up to the opening of the tag carrying the marker
+    start = html.rfind('<', 0, start)
+    end = len(html)
+    for marker in _RESULTS_END_MARKERS:
+        position = html.find(marker, start)
+        if position != -1:
+            end = min(end, html.rfind('<', start, position + 1))
+    return html[start:min(end, start + _MAX_RESULTS_CHARS)]
 
 class ScraperService:
-    def __init__(self, driver, logger, success_logger, ai_verifier=None):
+    def __init__(self, driver, logger, success_logger, ai_verifier=None, driver_pool=None):
         self.driver = driver
+        self.driver_pool = driver_pool  # Optional DriverPool for loading search pages in parallel
+        self._driver_lock = threading.Lock()  # Serializes use of the main driver across worker threads
+        self._stealth_drivers = weakref.WeakSet()  # Browsers that already have _STEALTH_JS installed
+        self._search_contexts = weakref.WeakKeyDictionary()  # Browser -> isolated context it searches in
+        self._driver_engines = weakref.WeakKeyDictionary()  # Pooled browser -> index of the engine it searches with
         self.logger = logger
         self.success_logger = success_logger
         self.ai_verifier = ai_verifier
         self.search_engines = ['bing', 'duckduckgo']  # Start with Bing as it's more reliable
         self.current_engine = 0
-        self.retry_count = 0
         self.max_retries = 3  # Keep for reliability
+        self.max_concurrent_searches = 8  # Search pages fetched at once over HTTP
+        self._last_was_blocked = False  # Set when an engine rate-limits or challenges us; gates pacing delays
+        
+        # Search and profile pages cached on disk for a day; set refresh_cache to ignore cached copies
+        self.html_cache = HTMLCache(os.path.join("data", "cache", "html_cache.sqlite"), ttl=86400, logger=logger)
+        self.refresh_cache = False
+        
+        # Plain HTTP session, with pooled keep-alive connections, for pages that don't need a browser
+        self.http = requests.Session()
+        self.http.headers.update(_SEARCH_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        
+        self._install_stealth(self.driver)
 
-    def rotate_search_engine(self):
-        """Rotate between search engines if one fails."""
-        self.current_engine = (self.current_engine + 1) % len(self.search_engines)
-        self.logger.info(f"Switching to {self.search_engines[self.current_engine]}")
+    def _install_stealth(self, driver) -> None:
+        """Register the anti-detection script to run on every new document in this browser."""
+        if driver is None or driver in self._stealth_drivers:
+            return
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _STEALTH_JS})
+            self._stealth_drivers.add(driver)
+        except Exception as e:
+            self.logger.warning(f"Could not install anti-detection script: {str(e)}")
+    
+    def close(self):
+        """Release the page cache."""
+        self.html_cache.close()
 
-    def get_search_url(self, query: str) -> str:
+    def rotate_search_engine(self, driver=None) -> int:
+        """Rotate between search engines if one fails, moving the browser into a fresh context."""
+        engine = (self._engine_for(driver) + 1) % len(self.search_engines)
+        
+        # Pooled browsers search concurrently, so each keeps its own engine; the main one sets the default
+        if driver is None or driver is self.driver:
+            self.current_engine = engine
+        else:
+            self._driver_engines[driver] = engine
+        
+        self.logger.info(f"Switching to {self.search_engines[engine]}")
+        if driver is not None:
+            self._open_search_context(driver)
+        return engine
+    
+    def _engine_for(self, driver=None) -> int:
+        """Index of the search engine a browser searches with (the shared default for the main browser)."""
+        if driver is None or driver is self.driver:
+            return self.current_engine
+        return self._driver_engines.get(driver, self.current_engine)
+    
+    def _open_search_context(self, driver) -> None:
+        """Switch a browser to a new incognito-style context so the next engine sees no old cookies."""
+        try:
+            context_id = driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            target_id = driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+            )["targetId"]
+            previous_context = self._search_contexts.get(driver)
+            driver.switch_to.window(target_id)
+            self._search_contexts[driver] = context_id
+            
+            # Drop the context this browser was searching in before; its default window is left alone
+            if previous_context:
+                driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": previous_context})
+            
+            # Scripts registered over CDP belong to the old page, so register them again
+            self._stealth_drivers.discard(driver)
+            self._install_stealth(driver)
+        except Exception as e:
+            self.logger.warning(f"Could not open a fresh browser context: {str(e)}")
+
+    def get_search_url(self, query: str, engine: Optional[int] = None) -> str:
         """Construct a search URL with U.S. focus and flexible formatting."""
         encoded_query = urllib.parse.quote_plus(query)
-        if self.search_engines[self.current_engine] == 'duckduckgo':
+        if engine is None:
+            engine = self.current_engine
+        if self.search_engines[engine] == 'duckduckgo':
             # DuckDuckGo: U.S. region, no exact quotes unless necessary
             return f"https://duckduckgo.com/?q={encoded_query}&kl=us-en"
         else:
@@ -40,26 +238,87 @@ class ScraperService:
         """Introduce a balanced delay to avoid blocks while maintaining speed."""
         delay = random.uniform(1, 3)  # Keep 1-3s for reliability
         time.sleep(delay)
+    
+    def _maybe_delay(self):
+        """Pace the next search only if the last one looked rate-limited or blocked."""
+        if self._last_was_blocked:
+            self.random_delay()
 
     def search_platform(self, query: str, platform: str, wait_time: int = 10) -> str:
+        """Perform a search over plain HTTP, falling back to the browser when that fails."""
+        html = self._fetch_search(query, platform)
+        if html:
+            return html
+        return self._browser_search(query, platform, wait_time)
+    
+    def _search_cache_key(self, query: str, platform: str, engine: Optional[int] = None) -> str:
+        """Cache key for a search on the given engine (the current one by default)."""
+        if engine is None:
+            engine = self.current_engine
+        return f"{self.search_engines[engine]}|{platform}|{query}"
+    
+    def _cached_page(self, key: str) -> Optional[str]:
+        """Return a cached page unless a refresh was requested."""
+        return None if self.refresh_cache else self.html_cache.get(key)
+    
+    def _fetch_search(self, query: str, platform: str) -> str:
+        """Fetch a search results page from the cache or without a browser, returning "" if it needs one."""
+        # Read the engine once so the URL and the cache key always agree
+        engine = self.current_engine
+        cache_key = self._search_cache_key(query, platform, engine)
+        cached = self._cached_page(cache_key)
+        if cached:
+            self.logger.info(f"Using cached search results for: {query}")
+            return cached
+        
+        search_url = self.get_search_url(f"site:{platform} {query}" if platform else query, engine)
+        html = self._fetch_results_direct(search_url)
+        if not html:
+            return ""
+        
+        self.logger.info(f"Fetched search results over HTTP: {search_url}")
+        self.html_cache.set(cache_key, html)
+        return html
+    
+    def _fetch_results_direct(self, search_url: str) -> str:
+        """GET a search results page as a rotating Chrome build, returning "" if it needs a browser."""
+        try:
+            response = self.http.get(search_url, headers=random.choice(_SEARCH_HEADER_ROTATION), timeout=8)
+        except requests.RequestException as e:
+            self.logger.debug(f"HTTP search failed for {search_url}: {str(e)}")
+            return ""
+        
+        # Blocked, challenged or script-rendered pages go to the browser instead
+        html = response.text
+        challenged = bool(_CHALLENGE_RE.search(html))
+        if response.status_code in (403, 429) or challenged:
+            self._last_was_blocked = True
+        if response.status_code != 200 or len(html) < 1000 or not _RESULT_MARKER_RE.search(html) or challenged:
+            self.logger.debug(f"HTTP search returned no results for {search_url} (status {response.status_code})")
+            return ""
+        self._last_was_blocked = False
+        return html
+    
+    def _browser_search(self, query: str, platform: str, wait_time: int = 10, driver=None) -> str:
         """Perform a reliable search with better timeout handling."""
-        self.retry_count = 0
-        while self.retry_count < self.max_retries:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        
+        # Use the main driver unless a pooled one is provided
+        driver = driver or self.driver
+        self._install_stealth(driver)
+        retry_count = 0
+        while retry_count < self.max_retries:
             try:
-                # Clear cookies and cache
-                self.driver.delete_all_cookies()
-                # Enhance anti-detection
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                self.driver.execute_script("""
-                    Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-                    Object.defineProperty(navigator, 'platform', {get: () => 'Win32'});
-                """)
                 # Simulate human behavior
-                self.simulate_human_behavior()
-                # Build and perform the search
-                search_url = self.get_search_url(f"site:{platform} {query}" if platform else query)
+                self.simulate_human_behavior(driver)
+                # Build and perform the search on this browser's engine, which other threads can't change
+                engine = self._engine_for(driver)
+                search_url = self.get_search_url(f"site:{platform} {query}" if platform else query, engine)
                 self.logger.info(f"Searching: {search_url}")
-                self.driver.get(search_url)
+                driver.get(search_url)
                 
                 # Use fewer, more reliable selectors with shorter initial timeout
                 primary_selectors = [
@@ -71,17 +330,23 @@ class ScraperService:
                 for selector in primary_selectors:
                     try:
                         # Start with shorter timeout (5s)
-                        WebDriverWait(self.driver, 5).until(
+                        WebDriverWait(driver, 5).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                         )
                         # Ensure JavaScript has fully loaded
-                        time.sleep(1)  # Shorter buffer for dynamic content
-                        return self.driver.page_source
+                        self._wait_until_ready(driver)
+                        html = driver.page_source
+                        self.html_cache.set(self._search_cache_key(query, platform, engine), html)
+                        self._last_was_blocked = False
+                        return html
                     except TimeoutException:
                         # Just continue to next selector, don't log warning yet
                         continue
                 
-                # If primary selectors failed, try fallback selectors with original timeout
+                # If primary selectors failed, results are missing or blocked, so slow down
+                self._last_was_blocked = True
+                
+                # Try fallback selectors with original timeout
                 fallback_selectors = [
                     "#links",                      # DuckDuckGo alternative
                     ".results",                    # Generic
@@ -90,47 +355,73 @@ class ScraperService:
                 
                 for selector in fallback_selectors:
                     try:
-                        WebDriverWait(self.driver, wait_time).until(
+                        WebDriverWait(driver, wait_time).until(
                             EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                         )
                         # Ensure JavaScript has fully loaded
-                        time.sleep(1)  # Shorter buffer for dynamic content
-                        return self.driver.page_source
+                        self._wait_until_ready(driver)
+                        html = driver.page_source
+                        self.html_cache.set(self._search_cache_key(query, platform, engine), html)
+                        return html
                     except TimeoutException:
                         self.logger.warning(f"Timeout waiting for {selector} on {search_url}")
                         continue
                 
                 # If we got here, try to return whatever page source we have
-                if self.driver.page_source and len(self.driver.page_source) > 1000:
+                if driver.page_source and len(driver.page_source) > 1000:
                     self.logger.warning(f"Using partial page source for {search_url}")
-                    return self.driver.page_source
+                    return driver.page_source
                     
                 # Otherwise rotate engine and retry
-                self.rotate_search_engine()
+                self.rotate_search_engine(driver)
             except WebDriverException as e:
                 self.logger.warning(f"WebDriver error: {str(e)}")
-                self.handle_error()
+                self.handle_error(retry_count, driver)
             except Exception as e:
                 self.logger.error(f"Unexpected error: {str(e)}")
-                self.handle_error()
-            self.retry_count += 1
+                self.handle_error(retry_count, driver)
+            retry_count += 1
         self.logger.error(f"All retries failed for query: {query}")
         return ""
 
-    def handle_error(self):
+    def _wait_until_ready(self, driver, timeout: float = 3) -> None:
+        """Wait for the document to finish loading, giving up quietly after the timeout."""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            WebDriverWait(driver, timeout).until(lambda d: d.execute_script(_READY_SCRIPT))
+        except TimeoutException:
+            self.logger.debug("Page still loading; using what has rendered so far")
+    
+    def _wait_for_network_idle(self, driver, timeout: float = 3, quiet_period: float = 0.5) -> None:
+        """Wait until the page has requested no new resources for quiet_period seconds, up to timeout."""
+        deadline = time.monotonic() + timeout
+        last_count, last_change = -1, time.monotonic()
+        while time.monotonic() < deadline:
+            count = driver.execute_script(_RESOURCE_COUNT_SCRIPT)
+            now = time.monotonic()
+            if count != last_count:
+                last_count, last_change = count, now
+            elif now - last_change >= quiet_period:
+                return
+            time.sleep(0.1)
+    
+    def handle_error(self, retry_count: int = 0, driver=None):
         """Handle errors with balanced backoff for reliability."""
-        wait_time = min(120, (2 ** self.retry_count) + random.uniform(1, 3))
+        wait_time = min(30, (2 ** retry_count) + random.uniform(0, 1))
         self.logger.info(f"Waiting {wait_time:.2f} seconds before retry")
         time.sleep(wait_time)
-        self.rotate_search_engine()
+        self.rotate_search_engine(driver)
 
-    def simulate_human_behavior(self):
+    def simulate_human_behavior(self, driver=None):
         """Simulate human-like interactions to avoid anti-scraping blocks."""
+        driver = driver or self.driver
         try:
             scroll_amount = random.randint(200, 400)
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
+            driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
             time.sleep(random.uniform(0.5, 1.5))
-            self.driver.execute_script("""
+            driver.execute_script("""
                 var event = new MouseEvent('mousemove', {
                     'clientX': arguments[0],
                     'clientY': arguments[1]
@@ -194,25 +485,69 @@ class ScraperService:
         # Generate advanced search queries with AI
         queries, reasoning = self.ai_verifier.generate_advanced_search_queries(athlete_info)
         self.logger.info(f"AI generated {len(queries)} search queries for {full_name}")
+        
+        # Drop queries that differ only in case, spacing or the order of site: filters
+        seen_queries = set()
+        unique_queries = []
+        for query in queries:
+            key = _canonical_query(query)
+            if key not in seen_queries:
+                seen_queries.add(key)
+                unique_queries.append(query)
+        if len(unique_queries) < len(queries):
+            self.logger.info(f"Skipping {len(queries) - len(unique_queries)} duplicate search queries")
+        queries = unique_queries
         self.logger.debug(f"AI reasoning for queries: {reasoning[:200]}...")
         
         # Track candidate profiles across all searches
         all_candidates = []
+        seen_urls = set()  # URLs of every candidate collected so far
         
-        # Execute each search query
+        # Fetch every search page concurrently over HTTP; pages that need a browser are loaded below
+        searches = []
         for query in queries:
-            self.logger.info(f"Executing AI-generated query: {query}")
+            searches.append((query, ""))
+            searches.extend((f"{query} site:{domain}", domain) for domain in platforms)
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_searches) as executor:
+            pages = dict(zip(searches, executor.map(lambda search: self._fetch_search(*search), searches)))
+        needs_browser = [search for search, html in pages.items() if not html]
+        
+        # With a driver pool, load the pages that need a browser in parallel too, one browser per thread
+        if self.driver_pool and needs_browser:
+            def browse(search):
+                with self.driver_pool.driver() as driver:
+                    return self._browser_search(*search, driver=driver)
             
-            # Perform general search
-            html = self.search_platform(query, "")
-            if html:
-                # Let AI analyze the search results
-                candidates = self.ai_verifier.analyze_search_results(html, athlete_info)
+            with ThreadPoolExecutor(max_workers=self.driver_pool.size) as executor:
+                pages.update(zip(needs_browser, executor.map(browse, needs_browser)))
+        else:
+            for search in needs_browser:
+                self.logger.info(f"Executing AI-generated query in browser: {search[0]}")
+                pages[search] = self._browser_search(*search)
+                
+                # Only sequential browser searches need pacing, and only once an engine pushes back
+                self._maybe_delay()
+        
+        # Let AI analyze every results page together, falling back to one request per page
+        # Only the results section goes to the AI and the contact extractors
+        loaded = [(query, domain, pages[(query, domain)]) for query, domain in searches if pages[(query, domain)]]
+        results_pages = [(query, domain, _slice_results(html)) for query, domain, html in loaded]
+        analyze_batch = getattr(self.ai_verifier, 'analyze_search_results_batch', None)
+        if analyze_batch:
+            analyses = analyze_batch(results_pages, athlete_info)
+        else:
+            analyses = [self.ai_verifier.analyze_search_results(html, athlete_info) for _, _, html in results_pages]
+        
+        for (query, domain, html), (_, _, results_html), candidates in zip(loaded, results_pages, analyses):
+            if not domain:
+                # General search results
                 all_candidates.extend(candidates)
+                seen_urls.update(candidate.get("url") for candidate in candidates)
                 
                 # Extract contact info directly
-                emails = self.extract_emails(html)
-                phones = self.extract_phones(html)
+                contacts = self.extract_all(results_html)
+                emails = contacts['emails']
+                phones = contacts['phones']
                 
                 # Add emails and phones as candidates for AI verification
                 for email in emails:
@@ -222,6 +557,7 @@ class ScraperService:
                         "confidence": 0.5,  # Initial confidence
                         "reasoning": "Email found in search results"
                     })
+                    seen_urls.add(email)
                 
                 for phone in phones:
                     all_candidates.append({
@@ -230,34 +566,28 @@ class ScraperService:
                         "confidence": 0.5,  # Initial confidence
                         "reasoning": "Phone found in search results"
                     })
-            
-            # Also perform platform-specific searches
-            for domain, key in platforms.items():
-                platform_query = f"{query} site:{domain}"
-                html = self.search_platform(platform_query, domain)
-                if html:
-                    # Let AI analyze the platform-specific results
-                    platform_candidates = self.ai_verifier.analyze_search_results(html, athlete_info)
-                    
-                    # Add platform information
-                    for candidate in platform_candidates:
-                        candidate["platform"] = key
-                    
-                    all_candidates.extend(platform_candidates)
-                    
-                    # Also extract links directly as backup
-                    links = self.extract_social_links(html, domain)
-                    for link in links:
-                        # Check if this link is already in candidates
-                        if not any(c.get("url") == link for c in all_candidates):
-                            all_candidates.append({
-                                "url": link,
-                                "platform": key,
-                                "confidence": 0.4,  # Lower initial confidence
-                                "reasoning": "Link extracted from platform-specific search"
-                            })
+                    seen_urls.add(phone)
+            else:
+                # Platform-specific search results
+                key = platforms[domain]
+                for candidate in candidates:
+                    candidate["platform"] = key
+                
+                all_candidates.extend(candidates)
+                seen_urls.update(candidate.get("url") for candidate in candidates)
                 
-                self.random_delay()
+                # Also extract links directly as backup
+                links = self.extract_social_links(html[:_MAX_LINK_SCAN_CHARS], domain)
+                for link in links:
+                    # Check if this link is already in candidates
+                    if link not in seen_urls:
+                        seen_urls.add(link)
+                        all_candidates.append({
+                            "url": link,
+                            "platform": key,
+                            "confidence": 0.4,  # Lower initial confidence
+                            "reasoning": "Link extracted from platform-specific search"
+                        })
         
         # Group candidates by platform
         platform_candidates = {}
@@ -268,7 +598,8 @@ class ScraperService:
                     platform_candidates[platform] = []
                 platform_candidates[platform].append(candidate)
         
-        # Select the best candidate for each platform
+        # Select the best candidate for each platform; medium-confidence profiles are verified concurrently below
+        to_verify = {}
         for platform, candidates in platform_candidates.items():
             # Sort by confidence
             sorted_candidates = sorted(candidates, key=lambda x: x.get("confidence", 0), reverse=True)
@@ -284,29 +615,22 @@ class ScraperService:
                     self.logger.info(f"High confidence match for {platform}: {url} ({confidence:.2f})")
                 # For medium confidence, try to verify with profile content if possible
                 elif confidence > 0.5 and platform in platforms.values():
-                    try:
-                        # Try to fetch and analyze the profile content
-                        profile_content = self.fetch_profile_content(url)
-                        is_match, verified_confidence, reasoning = self.ai_verifier.analyze_profile_content(
-                            url, profile_content, athlete_info
-                        )
-                        
-                        if is_match and verified_confidence > 0.6:
-                            result[platform] = url
-                            self.logger.info(f"Verified match for {platform}: {url} ({verified_confidence:.2f})")
-                        else:
-                            self.logger.info(f"Rejected after content analysis: {url} ({verified_confidence:.2f})")
-                    except Exception as e:
-                        self.logger.warning(f"Error analyzing profile content: {str(e)}")
-                        # Fall back to original confidence
-                        if confidence > 0.6:
-                            result[platform] = url
-                            self.logger.info(f"Using original confidence for {platform}: {url} ({confidence:.2f})")
+                    to_verify[platform] = best_candidate
                 # For lower confidence, use if it's the best we have
                 elif confidence > 0.6:
                     result[platform] = url
                     self.logger.info(f"Medium confidence match for {platform}: {url} ({confidence:.2f})")
         
+        if to_verify:
+            with ThreadPoolExecutor(max_workers=len(to_verify)) as executor:
+                verified = executor.map(
+                    lambda item: self._verify_profile_content(item[0], item[1], athlete_info),
+                    to_verify.items()
+                )
+                for platform, url in zip(to_verify, verified):
+                    if url:
+                        result[platform] = url
+        
         # Log results
         found_items = {k: v for k, v in result.items() if v is not None}
         if found_items:
@@ -314,6 +638,29 @@ class ScraperService:
         
         return result
     
+    def _verify_profile_content(self, platform: str, candidate: Dict[str, Any], athlete_info: Dict[str, Any]) -> Optional[str]:
+        """Verify a candidate against its profile page content, returning its URL if it matches."""
+        confidence = candidate.get("confidence", 0)
+        url = candidate.get("url")
+        try:
+            # Try to fetch and analyze the profile content
+            profile_content = self.fetch_profile_content(url)
+            is_match, verified_confidence, reasoning = self.ai_verifier.analyze_profile_content(
+                url, profile_content, athlete_info
+            )
+            
+            if is_match and verified_confidence > 0.6:
+                self.logger.info(f"Verified match for {platform}: {url} ({verified_confidence:.2f})")
+                return url
+            self.logger.info(f"Rejected after content analysis: {url} ({verified_confidence:.2f})")
+        except Exception as e:
+            self.logger.warning(f"Error analyzing profile content: {str(e)}")
+            # Fall back to original confidence
+            if confidence > 0.6:
+                self.logger.info(f"Using original confidence for {platform}: {url} ({confidence:.2f})")
+                return url
+        return None
+    
     def _traditional_search(self, first_name: str, last_name: str, platforms: Dict[str, str]) -> Dict[str, Optional[str]]:
         """Perform traditional search for athlete profiles (legacy method)."""
         full_name = f"{first_name} {last_name}"
@@ -327,6 +674,10 @@ class ScraperService:
         
         context_keywords = ["athlete", "college", "sports"]  # Simplified, broader keywords
         name_parts = [first_name.lower(), last_name.lower()]
+        
+        # One alternation per check instead of a Python-level any() over the parts for every link
+        name_re = re.compile('|'.join(map(re.escape, name_parts)))
+        email_hint_re = re.compile('|'.join(map(re.escape, name_parts + ['edu', 'athletics'])))
 
         # Social media searches with flexible, broader queries
         for domain, key in platforms.items():
@@ -337,16 +688,16 @@ class ScraperService:
             for query in search_queries:
                 html = self.search_platform(query, domain)
                 if html:
-                    links = self.extract_social_links(html, domain)
+                    links = self.extract_social_links(html[:_MAX_LINK_SCAN_CHARS], domain)
                     for link in links:
-                        if any(part in link.lower() for part in name_parts):
+                        if name_re.search(link):
                             result[key] = link
                             break
                     if not result[key] and links:
                         result[key] = links[0]
                     if result[key]:
                         break
-                self.random_delay()
+                self._maybe_delay()
 
         # Contact info searches with broader queries
         contact_queries = [
@@ -356,10 +707,11 @@ class ScraperService:
         for query in contact_queries:
             html = self.search_platform(query, "")
             if html:
-                emails = self.extract_emails(html)
-                phones = self.extract_phones(html)
+                contacts = self.extract_all(_slice_results(html))
+                emails = contacts['emails']
+                phones = contacts['phones']
                 for email in emails:
-                    if any(part in email.lower() for part in name_parts) or any(kw in email.lower() for kw in ['edu', 'athletics']):
+                    if email_hint_re.search(email):
                         result["email"] = email
                         break
                 if not result["email"] and emails:
@@ -368,52 +720,85 @@ class ScraperService:
                     result["phone"] = phones[0]
                 if result["email"] or result["phone"]:
                     break
-            self.random_delay()
+            self._maybe_delay()
 
         found_items = {k: v for k, v in result.items() if v is not None}
         if found_items:
             self.success_logger.info(f"Found for {full_name}: {found_items}")
         return result
     
+    def _try_requests(self, url: str) -> str:
+        """Fetch a page without a browser, returning "" if it is blocked or needs JavaScript."""
+        try:
+            response = self.http.get(url, timeout=6)
+        except requests.RequestException as e:
+            self.logger.debug(f"HTTP fetch failed for {url}: {str(e)}")
+            return ""
+        
+        if response.status_code != 200 or len(response.text) < 2000 or 'challenge' in response.text.lower():
+            return ""
+        return response.text
+    
     def fetch_profile_content(self, url: str) -> str:
         """Fetch the content of a profile page."""
         self.logger.info(f"Fetching profile content: {url}")
+        
+        cached = self._cached_page(url)
+        if cached:
+            self.logger.info(f"Using cached profile content: {url}")
+            return cached
+        
+        # Pages that render without JavaScript don't need the browser. Social profiles are
+        # client-rendered: a plain GET gets an app shell or login wall, so they always use it.
+        html = "" if _is_js_rendered(url) else self._try_requests(url)
+        if html:
+            self.logger.info(f"Fetched profile content over HTTP: {url}")
+            self.html_cache.set(url, html)
+            return html
+        
+        from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
         try:
-            self.driver.get(url)
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Simulate human behavior
-            self.simulate_human_behavior()
-            
-            # Scroll down to load more content
-            self.driver.execute_script("window.scrollBy(0, 500)")
-            time.sleep(1)
-            self.driver.execute_script("window.scrollBy(0, 500)")
-            time.sleep(1)
-            
-            # Get page source
-            return self.driver.page_source
+            with self._driver_lock:
+                return self._browser_fetch(url)
         except (TimeoutException, WebDriverException, NoSuchElementException) as e:
             self.logger.warning(f"Error fetching profile content: {str(e)}")
             return ""
+    
+    def _browser_fetch(self, url: str) -> str:
+        """Load a profile page in the main driver and return its HTML."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        self.driver.get(url)
+        
+        # Wait for page to load
+        WebDriverWait(self.driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        
+        # Simulate human behavior
+        self.simulate_human_behavior()
+        
+        # Scroll down to load more content, then wait for it to finish arriving
+        self.driver.execute_script("window.scrollBy(0, 500)")
+        self.driver.execute_script("window.scrollBy(0, 500)")
+        self._wait_for_network_idle(self.driver)
+        
+        # Get page source
+        html = self.driver.page_source
+        self.html_cache.set(url, html)
+        return html
 
     def extract_social_links(self, html: str, platform: str) -> List[str]:
         """Extract and clean social media URLs."""
         if not html:
             return []
-        soup = BeautifulSoup(html, 'html.parser')
-        links = []
-        for a in soup.find_all("a", href=True):
-            href = a["href"].lower()
-            if platform in href:
-                cleaned_url = self.clean_social_url(href, platform)
-                if cleaned_url:
-                    links.append(cleaned_url)
-        return list(set(links))
+        # Only href values are needed, so scan the raw HTML instead of building a DOM
+        hrefs = (href.lower() for href in _HREF_RE.findall(html))
+        links = (self.clean_social_url(href, platform) for href in hrefs if platform in href)
+        # dict.fromkeys dedupes in page order, so callers falling back to links[0] get the top result
+        return list(dict.fromkeys(link for link in links if link))
 
     def clean_social_url(self, url: str, platform: str) -> Optional[str]:
         """Clean the URL to produce a base profile URL."""
@@ -423,7 +808,7 @@ class ScraperService:
         if platform == 'twitter.com':
             if any(x in url for x in ['/status/', '/likes/', '/retweets/']):
                 return None
-            match = re.search(r'twitter\.com/([^/]+)', url)
+            match = _USERNAME_RES[platform].search(url)
             if match:
                 username = match.group(1)
                 if username not in ['home', 'search', 'explore']:
@@ -433,7 +818,7 @@ class ScraperService:
                 return None
             if 'profile.php?id=' in url:
                 return url
-            match = re.search(r'facebook\.com/([^/]+)', url)
+            match = _USERNAME_RES[platform].search(url)
             if match:
                 username = match.group(1)
                 if username not in ['public', 'pages', 'groups']:
@@ -441,7 +826,7 @@ class ScraperService:
         elif platform == 'instagram.com':
             if any(x in url for x in ['/p/', '/reel/', '/stories/']):
                 return None
-            match = re.search(r'instagram\.com/([^/]+)', url)
+            match = _USERNAME_RES[platform].search(url)
             if match:
                 username = match.group(1)
                 if username not in ['explore', 'direct', 'stories']:
@@ -452,21 +837,14 @@ class ScraperService:
         """Extract valid email addresses."""
         if not html:
             return []
-        email_pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-        emails = email_pattern.findall(html)
-        valid_emails = []
-        for email in set(emails):
-            if self.is_valid_email(email):
-                valid_emails.append(email.lower())
-        return valid_emails
+        return list(dict.fromkeys(m.group(0).lower() for m in _EMAIL_RE.finditer(html) if _is_valid_email_fast(m.group(0))))
 
     def is_valid_email(self, email: str) -> bool:
         """Perform basic email validation."""
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not _BASIC_EMAIL_RE.match(email):
             return False
-        disposable_domains = ['tempmail', 'throwaway', 'temporary']
         domain = email.split('@')[1].lower()
-        if any(x in domain for x in disposable_domains):
+        if _DISPOSABLE_RE.search(domain):
             return False
         return True
 
@@ -474,20 +852,32 @@ class ScraperService:
         """Extract and format phone numbers."""
         if not html:
             return []
-        phone_pattern = re.compile(r"""
-            (?:\+?1[-.]?)?          # Optional country code
-            (?:\s*\(?\d{3}\)?[-.\s]?)  # Area code
-            \d{3}[-.\s]?            # First 3 digits
-            \d{4}                   # Last 4 digits
-            """, re.VERBOSE)
-        phones = phone_pattern.findall(html)
-        cleaned_phones = []
-        for phone in set(phones):
-            digits = re.sub(r'\D', '', phone)
-            if len(digits) == 10:
-                formatted = f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-                cleaned_phones.append(formatted)
-            elif len(digits) == 11 and digits.startswith('1'):
-                formatted = f"({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
-                cleaned_phones.append(formatted)
-        return cleaned_phones
+        phones = (_format_phone(match.group(0).translate(_DIGIT_KEEP)) for match in _PHONE_RE.finditer(html))
+        return list(dict.fromkeys(phone for phone in phones if phone))
+
+    def extract_all(self, html: str) -> Dict[str, List[str]]:
+        """Extract emails, phones and social profile links in a single scan of the page."""
+        found = {'emails': {}, 'phones': {}, 'twitter': {}, 'facebook': {}, 'instagram': {}}
+        if not html:
+            return {kind: [] for kind in found}
+        
+        for match in _CONTACT_RE.finditer(html):
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'social':
+                href = value.lower()
+                for domain in _SOCIAL_DOMAINS:
+                    if domain in href:
+                        url = self.clean_social_url(href, domain)
+                        if url:
+                            found[domain.split('.')[0]][url] = None
+            elif kind == 'email':
+                if _is_valid_email_fast(value):
+                    found['emails'][value.lower()] = None
+            else:
+                phone = _format_phone(value.translate(_DIGIT_KEEP))
+                if phone:
+                    found['phones'][phone] = None
+        
+        # Dicts keep first-seen order while deduplicating
+        return {kind: list(values) for kind, values in found.items()}
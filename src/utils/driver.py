@@ -1,129 +1,107 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import random
 import os
+import re
+import glob
+import json
+import subprocess
 import time
-import string
+import secrets
+import shutil
+import socket
 import platform
 from pathlib import Path
+from functools import lru_cache, wraps
+from typing import Optional, Tuple
 
-def setup_chrome_driver(enable_cookies=True, user_data_dir=None, headless=False):
+# Ad and tracking requests blocked in every browser; pages are never screenshotted or parsed for them
+BLOCKED_URL_PATTERNS = [
+    '*doubleclick.net*',
+    '*googletagmanager.com*',
+    '*google-analytics.com*',
+    '*googlesyndication.com*',
+    '*facebook.net/tr*',
+    '*/pixel*',
+    '*.gif'
+]
+
+# Enhanced user agent list with modern browsers
+USER_AGENTS = [
+    # Modern Chrome
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    # Modern Firefox
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:123.0) Gecko/20100101 Firefox/123.0',
+    # Modern Edge
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0',
+    # Modern Safari
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15'
+]
+
+# User agents matching this machine's OS, chosen once at import
+_UA_BY_PLATFORM = {
+    'Windows': [ua for ua in USER_AGENTS if 'Windows' in ua],
+    'Darwin': [ua for ua in USER_AGENTS if 'Macintosh' in ua],
+    'Linux': [ua for ua in USER_AGENTS if 'Linux' in ua]
+}
+_PLATFORM_USER_AGENTS = _UA_BY_PLATFORM.get(platform.system()) or USER_AGENTS
+
+_BROWSER_PREFS = {
+    'credentials_enable_service': False,
+    'profile.password_manager_enabled': False,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.managed_default_content_settings.images': 1,
+    'profile.managed_default_content_settings.popups': 2,
+    # Nothing the scraper reads needs plugins, media devices or autoplaying video
+    'profile.default_content_setting_values.plugins': 2,
+    'profile.default_content_setting_values.media_stream': 2,
+    'profile.default_content_setting_values.autoplay': 2
+}
+
+# Project-level profile directory, resolved to an absolute path so it doesn't depend on the working directory
+_DEFAULT_DATA_DIR = str(Path(__file__).resolve().parents[2] / 'data' / 'chrome_data')
+_SHARED_DATA_DIR = os.path.join(os.path.dirname(_DEFAULT_DATA_DIR), 'chrome_shared')
+
+# Directories already created by this process
+_ensured_dirs = set()
+
+@lru_cache(maxsize=1)
+def _base_arguments() -> Tuple[str, ...]:
     """
-    Configure ChromeDriver with enhanced anti-detection measures and session persistence.
+    Chrome arguments shared by every browser this module starts.
     
-    Args:
-        enable_cookies: Whether to enable cookies persistence
-        user_data_dir: Directory to store user data for session persistence
-        headless: Whether to run in headless mode
-        
     Returns:
-        Configured Chrome WebDriver instance
+        Tuple of command-line arguments
     """
-    options = webdriver.ChromeOptions()
-    
-    # Enhanced anti-detection measures
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--disable-infobars')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-browser-side-navigation')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--no-sandbox')
-    options.add_experimental_option('excludeSwitches', ['enable-automation'])
-    options.add_experimental_option('useAutomationExtension', False)
-    
-    # Additional webdriver v2 CDP options to avoid detection
-    options.add_experimental_option('prefs', {
-        'credentials_enable_service': False,
-        'profile.password_manager_enabled': False,
-        'profile.default_content_setting_values.notifications': 2,
-        'profile.managed_default_content_settings.images': 1,
-        'profile.managed_default_content_settings.popups': 2
-    })
-    
-    # Add additional language and timezone settings to appear more human-like
-    options.add_argument('--lang=en-US,en;q=0.9')
-    options.add_argument('--disable-features=IsolateOrigins,site-per-process')
-    
-    # Enable cookies and session persistence with enhanced settings
-    if enable_cookies:
-        # Don't clear cookies between sessions
-        options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
-        options.add_argument('--profile-directory=Default')
-        
-        # Set up user data directory for session persistence
-        if user_data_dir:
-            data_dir = user_data_dir
-        else:
-            # Default to a directory in the project
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'chrome_data')
-        
-        # Create directory if it doesn't exist
-        Path(data_dir).mkdir(parents=True, exist_ok=True)
-        
-        options.add_argument(f'--user-data-dir={data_dir}')
-    
-    # Enhanced user agent list with modern browsers
-    user_agents = [
-        # Modern Chrome
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-        # Modern Firefox
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:123.0) Gecko/20100101 Firefox/123.0',
-        # Modern Edge
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0',
-        # Modern Safari
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.3 Safari/605.1.15'
-    ]
-    
-    # Select a user agent based on the platform for better consistency
-    current_platform = platform.system()
-    if current_platform == 'Windows':
-        platform_agents = [ua for ua in user_agents if 'Windows' in ua]
-    elif current_platform == 'Darwin':
-        platform_agents = [ua for ua in user_agents if 'Macintosh' in ua]
-    elif current_platform == 'Linux':
-        platform_agents = [ua for ua in user_agents if 'Linux' in ua]
-    else:
-        platform_agents = user_agents
-    
-    selected_agent = random.choice(platform_agents if platform_agents else user_agents)
-    options.add_argument(f'user-agent={selected_agent}')
-    
-    # Headless mode with enhanced settings if requested
-    if headless:
-        options.add_argument('--headless=new')  # New headless implementation
-        options.add_argument('--window-size=1920,1080')
-        # Add specific headless settings to avoid detection
-        options.add_argument('--disable-web-security')
-    else:
-        # For visible mode, use a randomized window size to appear more natural
-        width = random.randint(1024, 1920)
-        height = random.randint(768, 1080)
-        options.add_argument(f'--window-size={width},{height}')
-    
-    # Additional performance and stability options
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-popup-blocking')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--disable-backgrounding-occluded-windows')
-    
-    # Create the driver using webdriver-manager for automatic ChromeDriver management
-    try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-    except Exception as e:
-        print(f"Error with ChromeDriverManager: {e}. Falling back to default Chrome webdriver.")
-        driver = webdriver.Chrome(options=options)
-    
-    # Set page load and script timeouts to enhance stability
-    driver.set_page_load_timeout(40)  # Increased timeout
-    driver.set_script_timeout(40)  # Increased timeout
-    
-    # Execute enhanced anti-detection scripts
-    driver.execute_script("""
+    return (
+        # Enhanced anti-detection measures
+        '--disable-blink-features=AutomationControlled',
+        '--disable-infobars',
+        '--disable-dev-shm-usage',
+        '--disable-browser-side-navigation',
+        '--disable-gpu',
+        '--no-sandbox',
+        # Additional language and timezone settings to appear more human-like
+        '--lang=en-US,en;q=0.9',
+        '--disable-features=IsolateOrigins,site-per-process',
+        # Additional performance and stability options
+        '--disable-extensions',
+        '--disable-popup-blocking',
+        '--disable-notifications',
+        '--disable-backgrounding-occluded-windows'
+    )
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process, skipping the filesystem check on later calls."""
+    if path not in _ensured_dirs:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+# Anti-detection overrides installed in every browser; runs before each page's own scripts
+_STEALTH_JS = """
     // Overwrite the 'webdriver' property
     Object.defineProperty(navigator, 'webdriver', {
         get: () => undefined
@@ -166,13 +144,325 @@ def setup_chrome_driver(enable_cookies=True, user_data_dir=None, headless=False)
     if (!window.chrome.runtime) {
         window.chrome.runtime = {};
     }
-    """)
+"""
+
+# Keep-alive connections held open to chromedriver, so concurrent commands don't open new sockets
+COMMAND_POOL_SIZE = 20
+
+# Resolved chromedriver path, kept for the life of the process and in a sidecar file between runs
+_DRIVER_PATH_CACHE = None
+_DRIVER_PATH_FILE = os.path.join(_DEFAULT_DATA_DIR, 'driver_path.json')
+
+def _chrome_major_version() -> Optional[str]:
+    """
+    Detect the major version of the locally installed Chrome without starting it.
+    
+    Returns:
+        Major version string (e.g. "122"), or None if Chrome could not be found
+    """
+    system = platform.system()
+    if system == 'Windows':
+        commands = [['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version']]
+    elif system == 'Darwin':
+        commands = [['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version']]
+    else:
+        commands = [[name, '--version'] for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')]
+    
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+', output)
+        if match:
+            return match.group(1)
+    return None
+
+def _resolve_driver_path() -> str:
+    """
+    Find a chromedriver matching the installed Chrome, only asking webdriver-manager when none is known.
+    The CHROMEDRIVER_PATH environment variable, when it names an existing file, takes precedence.
+    
+    Returns:
+        Path to the chromedriver executable
+    """
+    global _DRIVER_PATH_CACHE
+    
+    # A driver baked into the environment (e.g. a CI image) bypasses detection and webdriver-manager entirely
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path and os.path.isfile(env_path):
+        return env_path
+    
+    if _DRIVER_PATH_CACHE and os.path.isfile(_DRIVER_PATH_CACHE):
+        return _DRIVER_PATH_CACHE
+    
+    chrome_version = _chrome_major_version()
+    
+    # Reuse the path recorded by an earlier run for this Chrome version
+    try:
+        with open(_DRIVER_PATH_FILE) as f:
+            recorded = json.load(f)
+        if recorded.get('chrome_version') == chrome_version and os.path.isfile(recorded.get('path', '')):
+            _DRIVER_PATH_CACHE = recorded['path']
+            return _DRIVER_PATH_CACHE
+    except (OSError, ValueError):
+        pass
+    
+    # Look for a driver webdriver-manager already downloaded for this version
+    path = None
+    if chrome_version:
+        executable = 'chromedriver.exe' if platform.system() == 'Windows' else 'chromedriver'
+        pattern = os.path.join(str(Path.home()), '.wdm', 'drivers', 'chromedriver', '*', f'{chrome_version}.*', '**', executable)
+        matches = sorted(m for m in glob.glob(pattern, recursive=True) if os.path.isfile(m))
+        if matches:
+            path = matches[-1]
+    
+    if not path:
+        # webdriver-manager is only imported when it actually has to download a driver
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+    
+    _DRIVER_PATH_CACHE = path
+    try:
+        _ensure_dir(os.path.dirname(_DRIVER_PATH_FILE))
+        with open(_DRIVER_PATH_FILE, 'w') as f:
+            json.dump({'chrome_version': chrome_version, 'path': path}, f)
+    except OSError as e:
+        print(f"Could not record chromedriver path: {e}")
+    return path
+
+def _enable_command_keep_alive(driver) -> None:
+    """
+    Send the driver's WebDriver commands over a pool of persistent connections.
+    
+    Args:
+        driver: WebDriver instance to configure
+    """
+    executor = driver.command_executor
+    executor.keep_alive = True
+    connection_manager = getattr(executor, '_conn', None) or executor._get_connection_manager()
+    connection_manager.connection_pool_kw.update(maxsize=COMMAND_POOL_SIZE, block=False)
+    
+    # Drop the single-connection pool opened for the new-session request; the next command builds a full one
+    connection_manager.clear()
+    executor._conn = connection_manager
+
+def _delay_first_navigation(driver) -> None:
+    """
+    Make the driver's first get() pause for a human-like moment before loading the page.
+    
+    Args:
+        driver: WebDriver instance to wrap
+    """
+    original_get = driver.get
+    
+    @wraps(original_get)
+    def get(url):
+        # Later navigations go straight to the original method
+        driver.get = original_get
+        time.sleep(random.uniform(0.5, 2.0))
+        return original_get(url)
     
-    # Add a randomized fingerprint hash to make each browser instance unique
-    fingerprint_hash = ''.join(random.choices(string.ascii_lowercase + string.digits, k=16))
-    driver.execute_script(f"window.browserFingerprint = '{fingerprint_hash}';")
+    driver.get = get
+
+def _quiet_service(executable_path: Optional[str] = None) -> Service:
+    """
+    Build a chromedriver Service that doesn't log, so an unread log pipe can never stall it.
+    
+    Args:
+        executable_path: chromedriver path, or None to let Selenium locate one
+        
+    Returns:
+        Service instance
+    """
+    service_args = ['--log-level=OFF', '--silent']
+    try:
+        return Service(executable_path=executable_path, service_args=service_args, log_output=subprocess.DEVNULL)
+    except TypeError:
+        # Selenium releases before log_output was added
+        return Service(executable_path=executable_path, service_args=service_args, log_path=os.devnull)
+
+def _add_launch_options(options, enable_cookies, user_data_dir, headless, load_images) -> None:
+    """
+    Add the arguments and prefs used when this module launches Chrome itself.
+    
+    Args:
+        options: ChromeOptions to extend
+        enable_cookies: Whether to enable cookies persistence
+        user_data_dir: Directory to store user data for session persistence
+        headless: Whether to run in headless mode
+        load_images: Whether to load images
+    """
+    # Static arguments are built once per process; only the per-browser ones are added below
+    for argument in _base_arguments():
+        options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    # Additional webdriver v2 CDP options to avoid detection
+    prefs = dict(_BROWSER_PREFS)
+    if not load_images:
+        # Text-only scraping skips image downloads entirely; the flag lasts only for this launch
+        options.add_argument('--blink-settings=imagesEnabled=false')
+    if enable_cookies or load_images:
+        # Prefs are merged into a persistent profile's Preferences file, so always allow images there;
+        # this also clears a block left behind by an earlier image-less launch
+        prefs['profile.managed_default_content_settings.images'] = 1
+    else:
+        prefs['profile.managed_default_content_settings.images'] = 2
+    options.add_experimental_option('prefs', prefs)
+    
+    # Enable cookies and session persistence with enhanced settings
+    if enable_cookies:
+        # Don't clear cookies between sessions
+        options.add_argument('--enable-features=NetworkService,NetworkServiceInProcess')
+        options.add_argument('--profile-directory=Default')
+        
+        # Set up user data directory for session persistence, defaulting to a directory in the project
+        data_dir = user_data_dir or _DEFAULT_DATA_DIR
+        _ensure_dir(data_dir)
+        
+        options.add_argument(f'--user-data-dir={data_dir}')
+    
+    # Select a user agent based on the platform for better consistency
+    options.add_argument(f'user-agent={random.choice(_PLATFORM_USER_AGENTS)}')
+    
+    # Headless mode with enhanced settings if requested
+    if headless:
+        options.add_argument('--headless=new')  # New headless implementation
+        options.add_argument('--window-size=1920,1080')
+        # Add specific headless settings to avoid detection
+        options.add_argument('--disable-web-security')
+    else:
+        # For visible mode, use a randomized window size to appear more natural
+        width = random.randint(1024, 1920)
+        height = random.randint(768, 1080)
+        options.add_argument(f'--window-size={width},{height}')
+
+def _chrome_binary() -> Optional[str]:
+    """
+    Locate the Chrome executable.
+    
+    Returns:
+        Path to Chrome, or None if it could not be found
+    """
+    system = platform.system()
+    if system == 'Windows':
+        candidates = [os.path.join(os.environ.get(var, ''), 'Google', 'Chrome', 'Application', 'chrome.exe')
+                      for var in ('PROGRAMFILES', 'PROGRAMFILES(X86)', 'LOCALAPPDATA')]
+    elif system == 'Darwin':
+        candidates = ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome']
+    else:
+        candidates = [shutil.which(name) for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')]
+    return next((path for path in candidates if path and os.path.isfile(path)), None)
+
+def launch_shared_chrome(port: int = 9222, user_data_dir: Optional[str] = None, headless: bool = True):
+    """
+    Start one Chrome with remote debugging enabled, for several workers to attach to as tabs
+    via setup_chrome_driver(cdp_endpoint=...).
+    
+    Args:
+        port: Remote debugging port
+        user_data_dir: Profile directory; must not be in use by another Chrome
+        headless: Whether to run in headless mode
+        
+    Returns:
+        Tuple of (Chrome process, "host:port" endpoint); terminate the process when done
+    """
+    binary = _chrome_binary()
+    if not binary:
+        raise FileNotFoundError("Could not find a Chrome executable to launch")
+    
+    data_dir = user_data_dir or _SHARED_DATA_DIR
+    _ensure_dir(data_dir)
+    
+    args = [binary, f'--remote-debugging-port={port}', f'--user-data-dir={data_dir}', *_base_arguments(),
+            f'--user-agent={random.choice(_PLATFORM_USER_AGENTS)}', '--window-size=1920,1080']
+    if headless:
+        args.append('--headless=new')
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    # Wait for the debugging port to accept connections
+    endpoint = f'127.0.0.1:{port}'
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process, endpoint
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    
+    process.terminate()
+    raise RuntimeError(f"Shared Chrome did not open its debugging port {port}")
+
+def setup_chrome_driver(enable_cookies=True, user_data_dir=None, headless=False, humanize: bool = False, load_images: bool = True,
+                        cdp_endpoint: Optional[str] = None):
+    """
+    Configure ChromeDriver with enhanced anti-detection measures and session persistence.
+    
+    Args:
+        enable_cookies: Whether to enable cookies persistence
+        user_data_dir: Directory to store user data for session persistence
+        headless: Whether to run in headless mode
+        humanize: Whether to pause briefly before the first page load, like a person starting a browser
+        load_images: Whether to load images; leave on for browsers that take screenshots
+        cdp_endpoint: "host:port" of a running Chrome (see launch_shared_chrome) to attach to in a new tab,
+            instead of launching a browser; the launch options above are then ignored
+        
+    Returns:
+        Configured Chrome WebDriver instance
+    """
+    options = webdriver.ChromeOptions()
+    
+    # Return from driver.get() at DOMContentLoaded rather than waiting for every subresource
+    options.page_load_strategy = 'eager'
+    
+    if cdp_endpoint:
+        # Attach to an already running Chrome; launch-time arguments can't be applied to it
+        options.add_experimental_option('debuggerAddress', cdp_endpoint)
+    else:
+        _add_launch_options(options, enable_cookies, user_data_dir, headless, load_images)
+    
+    # Create the driver using webdriver-manager for automatic ChromeDriver management
+    try:
+        service = _quiet_service(_resolve_driver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception as e:
+        print(f"Error with ChromeDriverManager: {e}. Falling back to default Chrome webdriver.")
+        driver = webdriver.Chrome(service=_quiet_service(), options=options)
+    
+    # Workers sharing one Chrome each get their own tab
+    if cdp_endpoint:
+        driver.switch_to.new_window('tab')
+    
+    # Reuse connections to chromedriver across commands and threads
+    try:
+        _enable_command_keep_alive(driver)
+    except Exception as e:
+        print(f"Could not enable keep-alive for WebDriver commands: {e}")
+    
+    # Set page load and script timeouts to enhance stability
+    driver.set_page_load_timeout(15)  # Pages load only to DOMContentLoaded with ads blocked
+    driver.set_script_timeout(40)  # Increased timeout
+    
+    # Block ad and tracking requests so pages settle sooner
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"Could not enable request blocking: {e}")
+    
+    # Install the anti-detection overrides and a randomized fingerprint hash (making each browser
+    # instance unique) with one CDP call, so they run before every page instead of only the current one
+    fingerprint_hash = secrets.token_hex(8)
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': _STEALTH_JS + f"window.browserFingerprint = '{fingerprint_hash}';\n"
+    })
     
-    # Small random delay to simulate human-like startup time
-    time.sleep(random.uniform(0.5, 2.0))
+    # Small random delay to simulate human-like startup time, taken at the first navigation
+    if humanize:
+        _delay_first_navigation(driver)
     
     return driver
@@ -0,0 +1,151 @@
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from selenium.common.exceptions import InvalidSessionIdException
+
+
+class DriverPool:
+    """
+    Fixed-size pool of Selenium WebDriver instances for concurrent workers.
+    Drivers are created lazily on first demand and handed out one per worker,
+    so no two threads ever share a browser. Each driver is recycled after
+    max_uses checkouts, or as soon as its session dies.
+    """
+
+    def __init__(self, size: int, driver_factory: Callable, logger=None, max_uses: int = 50):
+        """
+        Initialize the driver pool.
+
+        Args:
+            size: Maximum number of drivers in the pool
+            driver_factory: Callable returning a new WebDriver instance
+            logger: Logger instance for logging
+            max_uses: Checkouts after which a driver is quit and replaced
+        """
+        self.size = max(1, size)
+        self.driver_factory = driver_factory
+        self.logger = logger
+        self.max_uses = max(1, max_uses)
+
+        # Holds idle drivers, plus None for each slot whose driver was retired
+        self._idle = queue.Queue()
+        self._drivers: List = []
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Check out a driver, creating one if the pool is not yet full.
+
+        Args:
+            timeout: Seconds to wait for a driver to be released (None waits forever)
+
+        Returns:
+            WebDriver instance
+        """
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            # Reserve a slot under the lock, but start the browser outside it
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+
+            if can_create:
+                return self._start_driver(new_slot=True)
+            driver = self._idle.get(timeout=timeout)
+
+        # An empty slot left behind by a retired driver gets a fresh browser
+        if driver is None:
+            return self._start_driver(new_slot=False)
+        return driver
+
+    def _start_driver(self, new_slot: bool):
+        """Start a browser in a reserved slot, giving the slot back if startup fails."""
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            if new_slot:
+                with self._lock:
+                    self._created -= 1
+            else:
+                self._idle.put(None)
+            raise
+
+        with self._lock:
+            self._drivers.append(driver)
+            self._uses[id(driver)] = 0
+
+        if self.logger:
+            self.logger.debug(f"Driver pool started browser {len(self._drivers)}/{self.size}")
+        return driver
+
+    def release(self, driver, broken: bool = False) -> None:
+        """
+        Return a driver to the pool, clearing its cookies and cache for the next user.
+
+        Args:
+            driver: Driver previously returned by acquire()
+            broken: Whether the driver's session is known to be dead
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if not broken and uses < self.max_uses:
+            try:
+                driver.delete_all_cookies()
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                self._idle.put(driver)
+                return
+            except Exception as e:
+                # A browser that can't be reset is in no state to be reused
+                if self.logger:
+                    self.logger.debug(f"Could not reset pooled driver: {str(e)}")
+
+        self._retire(driver)
+
+    def _retire(self, driver) -> None:
+        """Quit a driver and leave its slot empty for the next acquire() to refill."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._uses.pop(id(driver), None)
+
+        try:
+            driver.quit()
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(f"Error quitting pooled driver: {str(e)}")
+        self._idle.put(None)
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Context manager that checks out a driver and always returns it."""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except InvalidSessionIdException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken)
+
+    def close(self) -> None:
+        """Quit every driver the pool has started."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+            self._uses = {}
+            self._created = 0
+
+        self._idle = queue.Queue()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(f"Error quitting pooled driver: {str(e)}")
@@ -1,4 +1,7 @@
-import pandas as pd
+from openpyxl import Workbook
+
+# Shared empty column for the fields the scraper fills in; the rows are only read from it
+_NONE_19 = (None,) * 19
 
 # Define the player data
 data = {
@@ -14,19 +17,21 @@ data = {
         "Goodman", "Harvey", "James", "Parker", "Stewart",
         "Baker", "Bozeman", "Brannon", "Brown"
     ],
-    "Twitter": [None] * 19,
-    "Facebook": [None] * 19,
-    "Instagram": [None] * 19,
-    "Email": [None] * 19,
-    "Phone": [None] * 19,
+    "Twitter": _NONE_19,
+    "Facebook": _NONE_19,
+    "Instagram": _NONE_19,
+    "Email": _NONE_19,
+    "Phone": _NONE_19,
 }
 
-# Create a DataFrame with the player data
-df = pd.DataFrame(data)
-
-# Save the DataFrame to an Excel file
+# Stream the header and rows straight into a write-only workbook
 output_file = "test_players.xlsx"
-df.to_excel(output_file, index=False)
+workbook = Workbook(write_only=True)
+sheet = workbook.create_sheet()
+sheet.append(list(data))
+for row in zip(*data.values()):
+    sheet.append(row)
+workbook.save(output_file)
 
 print(f"{output_file} has been created!")
 
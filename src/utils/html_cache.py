@@ -0,0 +1,76 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class HTMLCache:
+    """
+    SQLite-backed cache of fetched HTML pages with a time-to-live.
+    Safe to share between threads; all access goes through one connection under a lock.
+    """
+
+    def __init__(self, path: str, ttl: float = 86400, logger=None):
+        """
+        Open (or create) the cache database and drop expired pages.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds a cached page stays valid
+            logger: Logger instance for logging
+        """
+        self.ttl = ttl
+        self.logger = logger
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages (key TEXT PRIMARY KEY, html TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM pages WHERE stored_at < ?", (time.time() - self.ttl,))
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached page.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached HTML, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT html FROM pages WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, html: str) -> None:
+        """
+        Store a page, replacing any earlier copy.
+
+        Args:
+            key: Cache key
+            html: Page HTML
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages (key, html, stored_at) VALUES (?, ?, ?)",
+                    (key, html, time.time())
+                )
+        except sqlite3.Error as e:
+            if self.logger:
+                self.logger.warning(f"Could not cache page {key}: {str(e)}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,45 +1,112 @@
-from colorama import init, Fore, Style
+import atexit
 import logging
 import os
 import sys
+import time
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from datetime import datetime
+from functools import lru_cache
 
-# Initialize colorama for colored console output
-init()
+# None of the log formats use thread, process or caller details, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+@lru_cache(maxsize=1)
+def _init_colorama():
+    """Initialize colorama for colored console output, once, when a colored formatter is first built."""
+    import colorama
+    colorama.init()
+    return colorama
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels in console output"""
-    COLORS = {
-        'DEBUG': Fore.BLUE,
-        'INFO': Fore.GREEN,
-        'WARNING': Fore.YELLOW,
-        'ERROR': Fore.RED,
-        'CRITICAL': Fore.RED + Style.BRIGHT,
-    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        colorama = _init_colorama()
+        Fore, Style = colorama.Fore, colorama.Style
+        self.COLORS = {
+            'DEBUG': Fore.BLUE,
+            'INFO': Fore.GREEN,
+            'WARNING': Fore.YELLOW,
+            'ERROR': Fore.RED,
+            'CRITICAL': Fore.RED + Style.BRIGHT,
+        }
+        self.RESET = Style.RESET_ALL
+
+        # Colored level names, built once rather than per record
+        self._colored_levels = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+
+        # Timestamp text for the most recent second, shared by every record logged within it
+        self._last_second = None
+        self._last_second_text = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second_text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+            self._last_second = second
+        return f"{self._last_second_text}.{int(record.msecs):03d}"
 
     def format(self, record):
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
-        record.asctime = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-        return super().format(record)
+        record.levelname = self._colored_levels.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers see the same record, so hand it back uncolored
+            record.levelname = levelname
+
+def buffered_file_handler(path, level, fmt):
+    """
+    Create a size-rotated file handler that buffers records and writes them in batches.
+    Warnings and below wait for a full buffer; errors flush immediately, as does interpreter exit.
+
+    Args:
+        path: Log file path
+        level: Minimum level the handler records
+        fmt: Format string for the records
+
+    Returns:
+        MemoryHandler wrapping a RotatingFileHandler
+    """
+    file_handler = RotatingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=3)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(logging.Formatter(fmt))
+
+    handler = MemoryHandler(256, flushLevel=logging.ERROR, target=file_handler)
+    handler.setLevel(level)
+    atexit.register(handler.flush)
+    return handler
+
+_LOG_DIR = 'data/logs'
+
+# Loggers returned by the first setup_logger() call; later calls reuse them
+_CACHED = None
 
 def ensure_log_directory():
     """Ensure the logs directory exists."""
-    log_dir = 'data/logs'
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(_LOG_DIR, exist_ok=True)
 
 def setup_logger():
     """
     Set up and configure a logging system with colored console output
     and plain-text file logging for errors, successes, and results.
+    Only the first call configures anything; later calls return the same loggers.
     """
+    global _CACHED
+    if _CACHED:
+        return _CACHED
+
     ensure_log_directory()
 
     # Create root logger
     logger = logging.getLogger('SocialScraper')
     logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers.clear()
 
     # Console handler with colored output
     console_handler = logging.StreamHandler(sys.stdout)
@@ -49,43 +116,39 @@ def setup_logger():
 
     # File handlers for different log types
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    paths = {kind: os.path.join(_LOG_DIR, f'{kind}_{timestamp}.log') for kind in ('debug', 'error', 'success', 'results')}
 
     # General debug/info log (detailed operations)
-    debug_handler = logging.FileHandler(os.path.join('data/logs', f'debug_{timestamp}.log'))
-    debug_handler.setLevel(logging.DEBUG)
-    debug_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    debug_handler = buffered_file_handler(
+        paths['debug'], logging.DEBUG, '%(asctime)s - %(levelname)s - %(message)s'
+    )
     logger.addHandler(debug_handler)
 
     # Error log (critical issues)
-    error_handler = logging.FileHandler(os.path.join('data/logs', f'error_{timestamp}.log'))
-    error_handler.setLevel(logging.WARNING)
-    error_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    error_handler = buffered_file_handler(
+        paths['error'], logging.WARNING, '%(asctime)s - %(levelname)s - %(message)s'
+    )
     logger.addHandler(error_handler)
 
     # Success log (high-level success messages)
     success_logger = logging.getLogger('SuccessLog')
     success_logger.setLevel(logging.INFO)
-    success_handler = logging.FileHandler(os.path.join('data/logs', f'success_{timestamp}.log'))
-    success_handler.setLevel(logging.INFO)
-    success_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+    success_logger.propagate = False
+    success_logger.handlers.clear()
+    success_handler = buffered_file_handler(
+        paths['success'], logging.INFO, '%(asctime)s - %(message)s'
+    )
     success_logger.addHandler(success_handler)
 
     # Results log (plain-text scraped data, simple format)
     results_logger = logging.getLogger('ScraperResults')
     results_logger.setLevel(logging.INFO)
-    results_handler = logging.FileHandler(os.path.join('data/logs', f'results_{timestamp}.log'))
-    results_handler.setLevel(logging.INFO)
-    results_handler.setFormatter(logging.Formatter('%(asctime)s - Athlete: %(message)s'))
+    results_logger.propagate = False
+    results_logger.handlers.clear()
+    results_handler = buffered_file_handler(
+        paths['results'], logging.INFO, '%(asctime)s - Athlete: %(message)s'
+    )
     results_logger.addHandler(results_handler)
 
-    # Prevent duplicate handlers
-    for handler in logger.handlers[:]:
-        if isinstance(handler, logging.StreamHandler) and handler.stream == sys.stdout:
-            continue
-        logger.removeHandler(handler)
-    for handler in success_logger.handlers[:]:
-        success_logger.removeHandler(handler)
-    for handler in results_logger.handlers[:]:
-        results_logger.removeHandler(handler)
-
-    return logger, success_logger, results_logger
\ No newline at end of file
+    _CACHED = (logger, success_logger, results_logger)
+    return _CACHED
\ No newline at end of file
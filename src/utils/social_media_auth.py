@@ -1,9 +1,10 @@
 import os
 import time
 import json
+import atexit
+import threading
 import random
-import pickle
-import string
+import secrets
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -17,6 +18,296 @@ from selenium.common.exceptions import (
     ElementNotInteractableException, JavascriptException
 )
 
+# Cookie consent buttons, tried in order
+_GENERIC_COOKIE_SELECTORS = (
+    # Generic selectors
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept all')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'allow all')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept cookies')]",
+    "//button[contains(@id, 'accept') or contains(@class, 'accept')]",
+    "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'agree')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'got it')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'i agree')]",
+    "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'continue')]",
+    
+    # Platform-specific selectors
+    "//button[@data-cookiebanner='accept_button']",  # Facebook
+    "//button[contains(@class, 'js-cookie-consent-agree')]",  # Instagram
+    "//div[@role='button' and contains(., 'Accept')]",  # Twitter
+    "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'Accept')]",  # Twitter dialog
+    "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'I agree')]",  # Generic dialog
+    "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'Continue')]",  # Generic dialog
+)
+
+_PLATFORM_COOKIE_SELECTORS = {
+    'facebook': (
+        "//button[contains(@title, 'Accept')]",
+        "//button[contains(@title, 'Allow')]",
+        "//button[contains(text(), 'Only allow essential cookies')]",
+        "//button[contains(@aria-label, 'Allow')]",
+        "//button[contains(@aria-label, 'Accept')]",
+        "//div[@aria-label='Allow all cookies']",
+        "//div[@aria-label='Accept all cookies']",
+    ),
+    'instagram': (
+        "//button[contains(text(), 'Accept')]",
+        "//button[contains(@class, 'aOOlW')]",  # Instagram's cookie button class
+        "//button[contains(text(), 'Allow')]",
+        "//button[contains(text(), 'OK')]",
+        "//button[contains(text(), 'I Agree')]",
+    ),
+    'twitter': (
+        "//span[contains(text(), 'Accept all cookies')]/ancestor::div[@role='button']",
+        "//span[text()='Accept']/ancestor::div[@role='button']",
+        "//span[contains(text(), 'I agree')]/ancestor::div[@role='button']",
+        "//span[contains(text(), 'Allow')]/ancestor::div[@role='button']",
+        "//div[@data-testid='BottomBar']//span[contains(text(), 'Accept')]/ancestor::div[@role='button']",
+    ),
+}
+
+# Cookie banners/dialogs that signal a consent prompt is showing
+_COOKIE_DIALOG_XPATHS = (
+    "//div[contains(@class, 'cookie')]",
+    "//div[contains(@id, 'cookie')]",
+    "//div[contains(@class, 'gdpr')]",
+    "//div[contains(@id, 'gdpr')]",
+    "//div[contains(@class, 'consent')]",
+    "//div[contains(@id, 'consent')]",
+    "//div[@role='dialog']",
+)
+
+# Each platform's button selectors in priority order: generic first, then its own
+_COOKIE_BUTTON_SELECTORS = {
+    platform: _GENERIC_COOKIE_SELECTORS + selectors
+    for platform, selectors in _PLATFORM_COOKIE_SELECTORS.items()
+}
+
+# The selectors above joined into single XPath unions, so one WebDriver command
+# checks whether any candidate exists (matches come back in document order)
+_COOKIE_DIALOG_XPATH = " | ".join(_COOKIE_DIALOG_XPATHS)
+_GENERIC_COOKIE_XPATH = " | ".join(_GENERIC_COOKIE_SELECTORS)
+_COOKIE_BUTTON_XPATHS = {
+    platform: " | ".join(selectors) for platform, selectors in _COOKIE_BUTTON_SELECTORS.items()
+}
+
+# Returns the first rendered, enabled match of each XPath in arguments[0], keeping the
+# XPaths' order so buttons are tried by selector priority rather than document position
+_COOKIE_BUTTONS_JS = """
+const buttons = [];
+for (const xpath of arguments[0]) {
+    let result;
+    try {
+        result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    } catch (e) {
+        continue;
+    }
+    for (let i = 0; i < result.snapshotLength; i++) {
+        const node = result.snapshotItem(i);
+        if (node.getClientRects().length > 0 && !node.disabled) {
+            if (!buttons.includes(node)) buttons.push(node);
+            break;
+        }
+    }
+}
+return buttons;
+"""
+
+# Login indicators: a visible negative match means logged out, and at
+# least one positive match is required to count as logged in
+_TWITTER_NEGATIVE_XPATHS = (
+    "//a[contains(text(), 'Log in')]",
+    "//a[contains(text(), 'Sign up')]",
+    "//div[@data-testid='loginButton']",
+    "//span[contains(text(), 'Log in')]/ancestor::a",
+    "//span[contains(text(), 'Sign up')]/ancestor::a",
+    "//form[contains(@action, 'session')]",
+)
+_TWITTER_PROFILE_XPATHS = (
+    "//a[contains(@href, '/home')]",
+    "//a[contains(@data-testid, 'AppTabBar_Profile_Link')]",
+    "//div[@data-testid='SideNav_AccountSwitcher_Button']",
+    "//a[@aria-label='Profile']",
+)
+_FACEBOOK_NEGATIVE_XPATHS = (
+    "//form[contains(@action, 'login')]",
+    "//button[@name='login']",
+    "//a[contains(text(), 'Create New Account')]",
+    "//a[contains(text(), 'Sign Up')]",
+    "//div[contains(text(), 'Log Into Facebook')]",
+)
+_FACEBOOK_PROFILE_XPATHS = (
+    "//div[@aria-label='Your profile']",
+    "//a[contains(@href, '/me') or contains(@href, '/profile.php')]",
+    "//div[contains(@aria-label, 'Account')]",
+)
+_INSTAGRAM_NEGATIVE_XPATHS = (
+    "//form[contains(@id, 'loginForm')]",
+    "//button[contains(text(), 'Log In')]",
+    "//a[contains(text(), 'Sign up')]",
+    "//input[@name='username']",
+    "//input[@name='password']",
+)
+_INSTAGRAM_PROFILE_XPATHS = (
+    # Navigation links
+    "//a[contains(@href, '/direct/inbox/')]",
+    "//a[contains(@href, '/explore/')]",
+    "//div[@role='navigation']//a[contains(@href, '/')]",
+    "//a[contains(@href, '/accounts/activity/')]",
+    # Avatar
+    "//img[@data-testid='user-avatar']",
+    "//span[@role='link' and contains(@class, 'coreSpriteDesktopNavProfile')]",
+)
+
+# Indicators for the comprehensive checks, which need at least two visible
+# logged-in markers and no visible logged-out marker
+_TWITTER_LOGGED_IN_XPATHS = (
+    # Home timeline
+    "//div[@data-testid='primaryColumn']",
+    # Sidebar navigation
+    "//nav[@aria-label='Primary']",
+    # Profile icon
+    "//div[@data-testid='SideNav_AccountSwitcher_Button']",
+    # Tweet button
+    "//a[@data-testid='SideNav_NewTweet_Button']",
+)
+_TWITTER_LOGGED_OUT_XPATHS = (
+    # Login button
+    "//a[contains(text(), 'Log in')]",
+    # Sign up button
+    "//a[contains(text(), 'Sign up')]",
+    # Login form
+    "//form[contains(@action, 'session')]",
+)
+
+_FACEBOOK_LOGGED_IN_XPATHS = (
+    # Navigation bar
+    "//div[@role='navigation']",
+    # Profile link
+    "//a[contains(@href, '/me') or contains(@href, '/profile.php')]",
+    # Create post
+    "//div[contains(text(), 'What') and contains(text(), 'on your mind')]",
+    # Account menu
+    "//div[@aria-label='Account' or contains(@aria-label, 'Your profile')]",
+)
+_FACEBOOK_LOGGED_OUT_XPATHS = (
+    # Login form
+    "//form[contains(@action, 'login')]",
+    # Login button
+    "//button[@name='login']",
+    # Create account button
+    "//a[contains(text(), 'Create New Account') or contains(text(), 'Sign Up')]",
+)
+
+_INSTAGRAM_LOGGED_IN_XPATHS = (
+    # Navigation bar
+    "//div[@role='navigation']",
+    # Direct messages icon
+    "//a[contains(@href, '/direct/inbox/')]",
+    # Profile icon
+    "//a[contains(@href, '/accounts/activity/')]",
+    # Home feed elements
+    "//div[@role='feed']",
+    # Search box
+    "//input[@placeholder='Search']",
+)
+_INSTAGRAM_LOGGED_OUT_XPATHS = (
+    # Login form
+    "//form[contains(@id, 'loginForm')]",
+    # Login button
+    "//button[contains(text(), 'Log In')]",
+    # Sign up link
+    "//a[contains(text(), 'Sign up')]",
+)
+
+# Returns [number of visible matches among arguments[0], whether any of arguments[1] is visible]
+_INDICATOR_COUNT_JS = """
+const visible = (xpath) => {
+    try {
+        const node = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        return !!node && node.getClientRects().length > 0;
+    } catch (e) {
+        return false;
+    }
+};
+return [arguments[0].filter(visible).length, arguments[1].some(visible)];
+"""
+
+# Page text probed by the basic login checks
+_TWITTER_PAGE_TEXT = ("Home", "Explore", "Search", "Log in")
+_FACEBOOK_PAGE_TEXT = ("Search Facebook", "What's on your mind", "Create Post")
+_INSTAGRAM_PAGE_TEXT = ("Search", "Profile", "Log In")
+
+# "Not Now" button on Instagram's post-login prompts
+_INSTAGRAM_NOT_NOW_XPATH = "//button[text()='Not Now']"
+
+# Credential fields per platform, read from <PLATFORM>_<FIELD> environment variables
+_CREDENTIAL_FIELDS = {
+    'facebook': ('email', 'password'),
+    'instagram': ('username', 'password'),
+    'twitter': ('email', 'username', 'password'),
+}
+
+# Host to look for in the current URL, and the page to open when it's missing
+_PLATFORM_URLS = {
+    'twitter': ('twitter.com', 'https://twitter.com/home'),
+    'facebook': ('facebook.com', 'https://www.facebook.com/'),
+    'instagram': ('instagram.com', 'https://www.instagram.com/'),
+}
+
+_READY_SCRIPT = "return document.readyState === 'complete'"
+
+# Writes every entry of the dict in arguments[0] to localStorage
+_RESTORE_LOCAL_STORAGE_JS = "const d = arguments[0]; for (const k in d) { window.localStorage.setItem(k, d[k]); }"
+
+# Evaluates negative (arguments[0]) and positive (arguments[1]) XPaths in the page.
+# A negative counts only if its first match is rendered; a positive counts if anything matches.
+# Also reports which of the substrings in arguments[2] occur in the page markup, so the
+# full page_source never has to be sent back to Python.
+_LOGIN_CHECK_JS = """
+const first = (xpath) => {
+    try {
+        return document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {
+        return null;
+    }
+};
+return {
+    negative: arguments[0].map((xpath) => {
+        const node = first(xpath);
+        return !!node && node.getClientRects().length > 0;
+    }),
+    positive: arguments[1].map((xpath) => first(xpath) !== null),
+    text: ((html) => arguments[2].map((needle) => html.includes(needle)))(document.documentElement.outerHTML)
+};
+"""
+
+def _to_cdp_cookie(cookie, url):
+    """
+    Convert a WebDriver cookie dict into a CDP Network.CookieParam.
+    
+    Args:
+        cookie: Cookie as returned by driver.get_cookies()
+        url: Page URL used to scope cookies that carry no domain
+        
+    Returns:
+        Dictionary accepted by Network.setCookies
+    """
+    param = {'name': cookie['name'], 'value': cookie['value'], 'path': cookie.get('path', '/')}
+    if cookie.get('domain'):
+        param['domain'] = cookie['domain']
+    else:
+        param['url'] = url
+    if 'expiry' in cookie:
+        param['expires'] = cookie['expiry']
+    if 'secure' in cookie:
+        param['secure'] = cookie['secure']
+    if 'httpOnly' in cookie:
+        param['httpOnly'] = cookie['httpOnly']
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        param['sameSite'] = cookie['sameSite']
+    return param
+
 class SocialMediaAuth:
     """
     Enhanced authentication handler for social media platforms.
@@ -41,30 +332,20 @@ class SocialMediaAuth:
         else:
             self.screenshot_dir = os.path.join("data", "screenshots", "auth")
             
-        # Create screenshot directory if it doesn't exist
-        if not os.path.exists(self.screenshot_dir):
-            os.makedirs(self.screenshot_dir)
+        # Authentication screenshots are debug artifacts, only written when AUTH_SCREENSHOTS is set
+        self.screenshots_enabled = bool(os.environ.get('AUTH_SCREENSHOTS'))
+        if self.screenshots_enabled:
+            os.makedirs(self.screenshot_dir, exist_ok=True)
         
         # Set up session storage directory
         self.session_dir = os.path.join("data", "sessions")
         if not os.path.exists(self.session_dir):
             os.makedirs(self.session_dir)
             
-        # Load credentials from environment variables
+        # Load credentials from environment variables, e.g. TWITTER_USERNAME
         self.credentials = {
-            'facebook': {
-                'email': os.environ.get('FACEBOOK_EMAIL'),
-                'password': os.environ.get('FACEBOOK_PASSWORD')
-            },
-            'instagram': {
-                'username': os.environ.get('INSTAGRAM_USERNAME'),
-                'password': os.environ.get('INSTAGRAM_PASSWORD')
-            },
-            'twitter': {
-                'email': os.environ.get('TWITTER_EMAIL'),
-                'username': os.environ.get('TWITTER_USERNAME'),
-                'password': os.environ.get('TWITTER_PASSWORD')
-            }
+            platform: {field: os.environ.get(f"{platform.upper()}_{field.upper()}") for field in fields}
+            for platform, fields in _CREDENTIAL_FIELDS.items()
         }
         
         # Track authentication status with timestamps
@@ -108,8 +389,19 @@ class SocialMediaAuth:
         # Initialize session pool for each platform
         self.session_pool = self._load_session_pool()
         
+        # Pool changes are kept in memory and flushed to disk in the background
+        self.session_flush_interval = 30  # seconds
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        threading.Thread(target=self._flush_session_pool_loop, daemon=True).start()
+        atexit.register(self._flush_session_pool)
+        
         # Human-like typing speed range (time between keystrokes in seconds)
         self.type_speed_range = (0.05, 0.15)
+        
+        # Reusable waits for the login flows
+        self._wait10 = WebDriverWait(self.driver, 10)
+        self._wait5 = WebDriverWait(self.driver, 5)
     
     def _load_session_pool(self):
         """Load saved sessions from disk."""
@@ -120,22 +412,19 @@ class SocialMediaAuth:
         }
         
         try:
-            session_file = os.path.join(self.session_dir, "session_pool.pkl")
+            session_file = os.path.join(self.session_dir, "session_pool.json")
             if os.path.exists(session_file):
-                with open(session_file, 'rb') as f:
-                    loaded_pool = pickle.load(f)
+                with open(session_file, 'r', encoding='utf-8') as f:
+                    loaded_pool = json.load(f)
                     
-                    # Filter out expired sessions
-                    now = datetime.now()
-                    expiration = now - timedelta(hours=self.session_max_age)
+                    # Filter out expired sessions; isoformat() strings compare like the datetimes they encode
+                    cutoff_iso = (datetime.now() - timedelta(hours=self.session_max_age)).isoformat()
                     
                     for platform in session_pool:
-                        if platform in loaded_pool:
-                            session_pool[platform] = [
-                                session for session in loaded_pool[platform]
-                                if 'timestamp' in session and 
-                                datetime.fromisoformat(session['timestamp']) > expiration
-                            ]
+                        session_pool[platform] = [
+                            session for session in loaded_pool.get(platform, ())
+                            if session.get('timestamp', '') > cutoff_iso
+                        ]
                             
                 self.logger.info(f"Loaded session pool from disk with {sum(len(sessions) for sessions in session_pool.values())} valid sessions")
         except Exception as e:
@@ -146,23 +435,55 @@ class SocialMediaAuth:
     def _save_session_pool(self):
         """Save current session pool to disk."""
         try:
-            session_file = os.path.join(self.session_dir, "session_pool.pkl")
-            with open(session_file, 'wb') as f:
-                pickle.dump(self.session_pool, f)
+            session_file = os.path.join(self.session_dir, "session_pool.json")
+            
+            with self._save_lock:
+                self._dirty = False
+                
+                # Write to a temp file and swap it in, so a crash mid-write never leaves a truncated pool
+                tmp_file = session_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.session_pool, f, separators=(',', ':'))
+                os.replace(tmp_file, session_file)
             self.logger.info("Saved session pool to disk")
         except Exception as e:
             self.logger.error(f"Error saving session pool: {str(e)}")
     
+    def _flush_session_pool(self):
+        """Save the session pool if it has changed since the last save."""
+        if self._dirty:
+            self._save_session_pool()
+    
+    def _flush_session_pool_loop(self):
+        """Periodically flush pending session pool changes to disk."""
+        while True:
+            time.sleep(self.session_flush_interval)
+            self._flush_session_pool()
+    
     def _type_like_human(self, element, text):
-        """Type text with random delays to simulate human typing."""
-        for character in text:
-            element.send_keys(character)
+        """Type text in one burst, then its last character after a human-like pause."""
+        if not text:
+            return
+        # One command for the bulk of the text instead of one per character; the separate
+        # final keystroke keeps the field from looking like a paste
+        if len(text) > 1:
+            element.send_keys(text[:-1])
             time.sleep(random.uniform(*self.type_speed_range))
+        element.send_keys(text[-1])
+    
+    def _wait_for_page_ready(self, timeout=3):
+        """Wait until the current page has finished loading, for at most timeout seconds."""
+        try:
+            WebDriverWait(self.driver, timeout).until(lambda d: d.execute_script(_READY_SCRIPT))
+        except TimeoutException:
+            pass
     
     def _take_auth_screenshot(self, prefix):
         """Take a screenshot for debugging authentication issues."""
+        if not self.screenshots_enabled:
+            return
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.time_ns()
             filename = f"{prefix}_{timestamp}.png"
             screenshot_path = os.path.join(self.screenshot_dir, filename)
             self.driver.save_screenshot(screenshot_path)
@@ -179,7 +500,7 @@ class SocialMediaAuth:
         """
         try:
             # Generate a unique session ID
-            session_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=12))
+            session_id = secrets.token_hex(6)
             
             # Get cookies and local storage
             cookies = self.driver.get_cookies()
@@ -199,8 +520,8 @@ class SocialMediaAuth:
             # Update current session ID
             self.auth_status[platform]['session_id'] = session_id
             
-            # Save updated session pool
-            self._save_session_pool()
+            # Mark the pool for the next background flush
+            self._dirty = True
             
             self.logger.info(f"Saved {platform} session with ID {session_id}")
             return session_id
@@ -225,17 +546,9 @@ class SocialMediaAuth:
                 if not self.session_pool[platform]:
                     return False
                 
-                # Sort by timestamp and get the most recent
-                sessions = sorted(
-                    self.session_pool[platform], 
-                    key=lambda s: datetime.fromisoformat(s['timestamp']), 
-                    reverse=True
-                )
-                
-                if not sessions:
-                    return False
-                
-                session = sessions[0]
+                # Pick the most recent; isoformat() timestamps order the same as strings
+                # as they do as datetimes, so there is nothing to parse
+                session = max(self.session_pool[platform], key=lambda s: s['timestamp'])
             
             # Navigate to the platform homepage
             if platform == 'facebook':
@@ -250,31 +563,48 @@ class SocialMediaAuth:
             # Clear existing cookies
             self.driver.delete_all_cookies()
             
-            # Restore cookies
+            # Restore cookies, skipping repeats of the same name/domain/path
+            cookies = []
+            seen = set()
             for cookie in session['cookies']:
-                # Skip cookies that might cause issues
-                if 'expiry' in cookie:
-                    # Some platforms use timestamps in seconds, some in milliseconds
-                    if cookie['expiry'] > 32503680000:  # Year 3000 in milliseconds
-                        # Convert to seconds for compatibility
-                        cookie['expiry'] = int(cookie['expiry'] / 1000)
+                key = (cookie.get('name'), cookie.get('domain'), cookie.get('path'))
+                if key in seen:
+                    continue
+                seen.add(key)
                 
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception as cookie_err:
-                    self.logger.debug(f"Error adding cookie: {str(cookie_err)}")
+                cookie = dict(cookie)
+                # Some platforms use timestamps in seconds, some in milliseconds
+                if cookie.get('expiry', 0) > 32503680000:  # Year 3000 in milliseconds
+                    # Convert to seconds for compatibility
+                    cookie['expiry'] //= 1000
+                cookies.append(cookie)
+            
+            # Chrome can take every cookie in one CDP call; fall back to one add_cookie per cookie
+            try:
+                current_url = self.driver.current_url
+                self.driver.execute_cdp_cmd(
+                    'Network.setCookies',
+                    {'cookies': [_to_cdp_cookie(cookie, current_url) for cookie in cookies]}
+                )
+            except Exception as cdp_err:
+                self.logger.debug(f"CDP cookie restore failed, adding cookies one by one: {str(cdp_err)}")
+                for cookie in cookies:
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception as cookie_err:
+                        self.logger.debug(f"Error adding cookie: {str(cookie_err)}")
             
-            # Restore local storage
+            # Restore local storage in one call; passing the dict as an argument
+            # lets Selenium encode it, so quotes in keys or values are safe
             if session.get('local_storage'):
-                for key, value in session['local_storage'].items():
-                    self.driver.execute_script(f"window.localStorage.setItem('{key}', '{value}');")
+                self.driver.execute_script(_RESTORE_LOCAL_STORAGE_JS, session['local_storage'])
             
             # Refresh the page to activate the session
             self.driver.refresh()
-            time.sleep(3)
+            self._wait_for_page_ready(timeout=5)
             
             # Verify the session worked
-            is_logged_in = self._check_login_status(platform, extended_check=True)
+            is_logged_in = self._check_login_status(platform, extended_check=True, force=True)
             
             if is_logged_in:
                 self.logger.info(f"Successfully restored {platform} session {session['id']}")
@@ -286,7 +616,7 @@ class SocialMediaAuth:
                 self.logger.warning(f"Failed to restore {platform} session {session['id']}")
                 # Remove failed session from pool
                 self.session_pool[platform] = [s for s in self.session_pool[platform] if s['id'] != session['id']]
-                self._save_session_pool()
+                self._dirty = True
                 return False
                 
         except Exception as e:
@@ -306,93 +636,34 @@ class SocialMediaAuth:
         try:
             self.logger.info(f"Checking for cookie consent prompts on {platform}")
             
-            # More comprehensive selectors for cookie consent buttons
-            selectors = [
-                # Generic selectors
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept all')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'allow all')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept cookies')]",
-                "//button[contains(@id, 'accept') or contains(@class, 'accept')]",
-                "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'accept')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'agree')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'got it')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'i agree')]",
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'continue')]",
-                
-                # Platform-specific selectors
-                "//button[@data-cookiebanner='accept_button']",  # Facebook
-                "//button[contains(@class, 'js-cookie-consent-agree')]",  # Instagram
-                "//div[@role='button' and contains(., 'Accept')]",  # Twitter
-                "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'Accept')]",  # Twitter dialog
-                "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'I agree')]",  # Generic dialog
-                "//div[contains(@role, 'dialog')]//div[@role='button' and contains(., 'Continue')]",  # Generic dialog
-            ]
-            
-            # Add platform-specific selectors
-            if platform.lower() == 'facebook':
-                selectors.extend([
-                    "//button[contains(@title, 'Accept')]",
-                    "//button[contains(@title, 'Allow')]",
-                    "//button[contains(text(), 'Only allow essential cookies')]",
-                    "//button[contains(@aria-label, 'Allow')]",
-                    "//button[contains(@aria-label, 'Accept')]",
-                    "//div[@aria-label='Allow all cookies']",
-                    "//div[@aria-label='Accept all cookies']"
-                ])
-            elif platform.lower() == 'instagram':
-                selectors.extend([
-                    "//button[contains(text(), 'Accept')]",
-                    "//button[contains(@class, 'aOOlW')]",  # Instagram's cookie button class
-                    "//button[contains(text(), 'Allow')]",
-                    "//button[contains(text(), 'OK')]",
-                    "//button[contains(text(), 'I Agree')]"
-                ])
-            elif platform.lower() == 'twitter':
-                selectors.extend([
-                    "//span[contains(text(), 'Accept all cookies')]/ancestor::div[@role='button']",
-                    "//span[text()='Accept']/ancestor::div[@role='button']",
-                    "//span[contains(text(), 'I agree')]/ancestor::div[@role='button']",
-                    "//span[contains(text(), 'Allow')]/ancestor::div[@role='button']",
-                    "//div[@data-testid='BottomBar']//span[contains(text(), 'Accept')]/ancestor::div[@role='button']"
-                ])
-            
-            # Check for cookie banners/dialogs first
-            cookie_dialogs = [
-                "//div[contains(@class, 'cookie')]",
-                "//div[contains(@id, 'cookie')]",
-                "//div[contains(@class, 'gdpr')]",
-                "//div[contains(@id, 'gdpr')]",
-                "//div[contains(@class, 'consent')]",
-                "//div[contains(@id, 'consent')]",
-                "//div[@role='dialog']"
-            ]
-            
-            dialog_found = False
-            dialog_selector = None
-            for ds in cookie_dialogs:
-                try:
-                    dialog = WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((By.XPATH, ds))
-                    )
-                    dialog_found = True
-                    dialog_selector = ds
-                    self.logger.info(f"Found cookie dialog for {platform} with selector: {ds}")
-                    break
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            # If no dialog found, we might not need to handle cookies
-            if not dialog_found:
+            # Probe every dialog selector at once without waiting; callers have already
+            # let the page load, and most pages show no banner at all
+            dialogs = self.driver.find_elements(By.XPATH, _COOKIE_DIALOG_XPATH)
+            if not dialogs:
+                # If no dialog found, we might not need to handle cookies
                 self.logger.info(f"No cookie dialog found for {platform}")
                 return False
             
-            # Try each selector
-            for selector in selectors:
+            dialog = dialogs[0]
+            self.logger.info(f"Found cookie dialog for {platform}")
+            
+            # Wait once for any candidate button, then collect the visible ones in selector priority
+            # order with a single script call rather than a wait per selector
+            platform_key = platform.lower()
+            button_xpath = _COOKIE_BUTTON_XPATHS.get(platform_key, _GENERIC_COOKIE_XPATH)
+            try:
+                WebDriverWait(self.driver, 3).until(
+                    EC.presence_of_element_located((By.XPATH, button_xpath))
+                )
+                buttons = self.driver.execute_script(
+                    _COOKIE_BUTTONS_JS, _COOKIE_BUTTON_SELECTORS.get(platform_key, _GENERIC_COOKIE_SELECTORS)
+                ) or []
+            except TimeoutException:
+                buttons = []
+            
+            for cookie_button in buttons:
                 try:
-                    cookie_button = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    self.logger.info(f"Found cookie consent button for {platform} with selector: {selector}")
+                    self.logger.info(f"Found cookie consent button for {platform}")
                     
                     # Try to click with JavaScript if regular click fails
                     try:
@@ -403,37 +674,34 @@ class SocialMediaAuth:
                     time.sleep(1)
                     
                     # Check if the dialog is still visible
-                    if dialog_found and dialog_selector:
-                        try:
-                            WebDriverWait(self.driver, 2).until_not(
-                                EC.visibility_of_element_located((By.XPATH, dialog_selector))
-                            )
-                            self.logger.info(f"Cookie dialog closed successfully for {platform}")
-                        except TimeoutException:
-                            self.logger.info(f"Cookie dialog may still be visible for {platform}, trying next selector")
-                            continue
+                    try:
+                        WebDriverWait(self.driver, 2).until(EC.invisibility_of_element(dialog))
+                        self.logger.info(f"Cookie dialog closed successfully for {platform}")
+                    except TimeoutException:
+                        self.logger.info(f"Cookie dialog may still be visible for {platform}, trying next button")
+                        continue
                         
                     return True
-                except (TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException):
+                except (NoSuchElementException, ElementClickInterceptedException,
+                        StaleElementReferenceException, ElementNotInteractableException, JavascriptException):
                     continue
                     
             # If we get here, no button was found or clicked successfully
             self.logger.info(f"No cookie consent button found or clicked successfully for {platform}")
             
             # Last resort: try to click any button in the cookie dialog
-            if dialog_found and dialog_selector:
-                try:
-                    buttons = self.driver.find_elements(By.XPATH, f"{dialog_selector}//button")
-                    if buttons:
-                        self.logger.info(f"Trying last resort: clicking first button in cookie dialog for {platform}")
-                        try:
-                            buttons[0].click()
-                        except Exception:
-                            self.driver.execute_script("arguments[0].click();", buttons[0])
-                        time.sleep(1)
-                        return True
-                except Exception:
-                    pass
+            try:
+                buttons = dialog.find_elements(By.XPATH, ".//button")
+                if buttons:
+                    self.logger.info(f"Trying last resort: clicking first button in cookie dialog for {platform}")
+                    try:
+                        buttons[0].click()
+                    except Exception:
+                        self.driver.execute_script("arguments[0].click();", buttons[0])
+                    time.sleep(1)
+                    return True
+            except Exception:
+                pass
                     
             return False
             
@@ -441,41 +709,52 @@ class SocialMediaAuth:
             self.logger.warning(f"Error handling cookie consent: {str(e)}")
             return False
     
-    def _check_login_status(self, platform, extended_check=False):
+    def _check_login_status(self, platform, extended_check=False, force=False):
         """
         Check if we're logged in to a platform with extended verification.
         
         Args:
             platform: The platform to check (twitter, facebook, instagram)
             extended_check: Whether to perform extended verification
+            force: Check the page even if a login was verified within verification_max_age
             
         Returns:
             Boolean indicating login status
         """
+        platform = platform.lower()
+        status = self.auth_status.get(platform)
+        
+        # A login verified within verification_max_age is trusted without reloading the page
+        if (
+            not force and status and status['logged_in'] and status['last_verified'] and
+            (datetime.now() - status['last_verified']).total_seconds() < self.verification_max_age
+        ):
+            return True
+            
         try:
             # Make sure we're on the platform's page before checking
-            current_url = self.driver.current_url.lower()
-            if platform.lower() == "twitter" and "twitter.com" not in current_url:
-                self.driver.get("https://twitter.com/home")
-                time.sleep(3)
-            elif platform.lower() == "facebook" and "facebook.com" not in current_url:
-                self.driver.get("https://www.facebook.com/")
-                time.sleep(3)
-            elif platform.lower() == "instagram" and "instagram.com" not in current_url:
-                self.driver.get("https://www.instagram.com/")
-                time.sleep(3)
+            host, home_url = _PLATFORM_URLS.get(platform, (None, None))
+            if host and host not in self.driver.current_url.lower():
+                self.driver.get(home_url)
+                self._wait_for_page_ready()
                 
             # Handle any cookie consent dialogs that might appear
             self.handle_cookie_consent(platform)
                 
-            if platform.lower() == "twitter":
-                return self._is_twitter_logged_in(extended_check)
-            elif platform.lower() == "facebook":
-                return self._is_facebook_logged_in(extended_check)
-            elif platform.lower() == "instagram":
-                return self._is_instagram_logged_in(extended_check)
+            if platform == "twitter":
+                logged_in = self._is_twitter_logged_in(extended_check)
+            elif platform == "facebook":
+                logged_in = self._is_facebook_logged_in(extended_check)
+            elif platform == "instagram":
+                logged_in = self._is_instagram_logged_in(extended_check)
             else:
                 return False
+            
+            # Record the result so the next call within the window can skip the page checks
+            status['logged_in'] = logged_in
+            if logged_in:
+                status['last_verified'] = datetime.now()
+            return logged_in
                 
         except Exception as e:
             self.logger.error(f"Error checking login status for {platform}: {str(e)}")
@@ -484,30 +763,23 @@ class SocialMediaAuth:
     def _is_twitter_logged_in(self, extended_check=False):
         """Check if we're logged in to Twitter."""
         try:
+            # Evaluate every indicator in one in-page script instead of a WebDriver command per XPath
+            probe = self.driver.execute_script(
+                _LOGIN_CHECK_JS, _TWITTER_NEGATIVE_XPATHS, _TWITTER_PROFILE_XPATHS, _TWITTER_PAGE_TEXT
+            )
+            
             # Check for negative indicators first - these always indicate we're NOT logged in
-            negative_indicators = [
-                "//a[contains(text(), 'Log in')]",
-                "//a[contains(text(), 'Sign up')]", 
-                "//div[@data-testid='loginButton']",
-                "//span[contains(text(), 'Log in')]/ancestor::a",
-                "//span[contains(text(), 'Sign up')]/ancestor::a",
-                "//form[contains(@action, 'session')]"
-            ]
-            
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        self.logger.info(f"Twitter login negative indicator found: {indicator}")
-                        return False  # Definitely not logged in
-                except Exception:
-                    pass
+            for indicator, visible in zip(_TWITTER_NEGATIVE_XPATHS, probe['negative']):
+                if visible:
+                    self.logger.info(f"Twitter login negative indicator found: {indicator}")
+                    return False  # Definitely not logged in
             
-            # Basic check now
+            # Basic check now, from the substring flags the probe already returned
+            found = dict(zip(_TWITTER_PAGE_TEXT, probe['text']))
             basic_check = (
-                "Home" in self.driver.page_source and 
-                ("Explore" in self.driver.page_source or "Search" in self.driver.page_source) and
-                "Log in" not in self.driver.page_source
+                found["Home"] and
+                (found["Explore"] or found["Search"]) and
+                not found["Log in"]
             )
             
             if not basic_check:
@@ -516,23 +788,15 @@ class SocialMediaAuth:
                 
             # Always do extended check - it's more reliable
             # Look for elements that definitively indicate logged-in state
-            try:
-                profile_elements = self.driver.find_elements(By.XPATH, 
-                    "//a[contains(@href, '/home')] | //a[contains(@data-testid, 'AppTabBar_Profile_Link')] | " +
-                    "//div[@data-testid='SideNav_AccountSwitcher_Button'] | //a[@aria-label='Profile']")
-                
-                if len(profile_elements) == 0:
-                    self.logger.info("Twitter profile elements not found")
-                    return False
-                
-                # Take a screenshot to verify login status
-                self._take_auth_screenshot("twitter_login_verification")
-                
-                self.logger.info("Twitter login verified via profile elements")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error in Twitter extended login check: {str(e)}")
+            if not any(probe['positive']):
+                self.logger.info("Twitter profile elements not found")
                 return False
+            
+            # Take a screenshot to verify login status
+            self._take_auth_screenshot("twitter_login_verification")
+            
+            self.logger.info("Twitter login verified via profile elements")
+            return True
         except Exception as e:
             self.logger.error(f"Error checking Twitter login status: {str(e)}")
             return False
@@ -540,49 +804,13 @@ class SocialMediaAuth:
     def _is_twitter_logged_in_comprehensive(self):
         """Perform a comprehensive check to verify Twitter login status."""
         try:
-            # Check for common elements that indicate logged-in state
-            indicators = [
-                # Home timeline
-                "//div[@data-testid='primaryColumn']",
-                # Sidebar navigation
-                "//nav[@aria-label='Primary']",
-                # Profile icon
-                "//div[@data-testid='SideNav_AccountSwitcher_Button']",
-                # Tweet button
-                "//a[@data-testid='SideNav_NewTweet_Button']"
-            ]
-            
-            # Check for negative indicators
-            negative_indicators = [
-                # Login button
-                "//a[contains(text(), 'Log in')]",
-                # Sign up button
-                "//a[contains(text(), 'Sign up')]",
-                # Login form
-                "//form[contains(@action, 'session')]"
-            ]
-            
-            # Count positive and negative indicators
-            positive_count = 0
-            for indicator in indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        positive_count += 1
-                except Exception:
-                    pass
-            
-            # Check for any negative indicators
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        return False  # Found negative indicator
-                except Exception:
-                    pass
+            # Count visible positive indicators and look for any visible negative one in a single script call
+            positive_count, negative_found = self.driver.execute_script(
+                _INDICATOR_COUNT_JS, _TWITTER_LOGGED_IN_XPATHS, _TWITTER_LOGGED_OUT_XPATHS
+            )
             
             # Must have at least 2 positive indicators and no negative indicators
-            return positive_count >= 2
+            return not negative_found and positive_count >= 2
         except Exception as e:
             self.logger.error(f"Error in comprehensive Twitter login check: {str(e)}")
             return False
@@ -590,30 +818,19 @@ class SocialMediaAuth:
     def _is_facebook_logged_in(self, extended_check=False):
         """Check if we're logged in to Facebook."""
         try:
+            # Evaluate every indicator in one in-page script instead of a WebDriver command per XPath
+            probe = self.driver.execute_script(
+                _LOGIN_CHECK_JS, _FACEBOOK_NEGATIVE_XPATHS, _FACEBOOK_PROFILE_XPATHS, _FACEBOOK_PAGE_TEXT
+            )
+            
             # Check for negative indicators first - these always indicate we're NOT logged in
-            negative_indicators = [
-                "//form[contains(@action, 'login')]",
-                "//button[@name='login']",
-                "//a[contains(text(), 'Create New Account')]",
-                "//a[contains(text(), 'Sign Up')]",
-                "//div[contains(text(), 'Log Into Facebook')]"
-            ]
-            
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        self.logger.info(f"Facebook login negative indicator found: {indicator}")
-                        return False  # Definitely not logged in
-                except Exception:
-                    pass
+            for indicator, visible in zip(_FACEBOOK_NEGATIVE_XPATHS, probe['negative']):
+                if visible:
+                    self.logger.info(f"Facebook login negative indicator found: {indicator}")
+                    return False  # Definitely not logged in
             
-            # Basic check now
-            basic_check = (
-                "Search Facebook" in self.driver.page_source or
-                "What's on your mind" in self.driver.page_source or
-                "Create Post" in self.driver.page_source
-            )
+            # Basic check now, from the substring flags the probe already returned
+            basic_check = any(probe['text'])
             
             if not basic_check:
                 self.logger.info("Facebook basic login check failed")
@@ -621,23 +838,15 @@ class SocialMediaAuth:
                 
             # Always do extended check - it's more reliable
             # Look for elements that definitively indicate logged-in state
-            try:
-                profile_elements = self.driver.find_elements(By.XPATH, 
-                    "//div[@aria-label='Your profile'] | //a[contains(@href, '/me') or contains(@href, '/profile.php')] | " +
-                    "//div[@aria-label='Your profile'] | //div[contains(@aria-label, 'Account')]")
-                    
-                if len(profile_elements) == 0:
-                    self.logger.info("Facebook profile elements not found")
-                    return False
-                
-                # Take a screenshot to verify login status
-                self._take_auth_screenshot("facebook_login_verification")
-                
-                self.logger.info("Facebook login verified via profile elements")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error in Facebook extended login check: {str(e)}")
+            if not any(probe['positive']):
+                self.logger.info("Facebook profile elements not found")
                 return False
+            
+            # Take a screenshot to verify login status
+            self._take_auth_screenshot("facebook_login_verification")
+            
+            self.logger.info("Facebook login verified via profile elements")
+            return True
         except Exception as e:
             self.logger.error(f"Error checking Facebook login status: {str(e)}")
             return False
@@ -645,49 +854,13 @@ class SocialMediaAuth:
     def _is_facebook_logged_in_comprehensive(self):
         """Perform a comprehensive check to verify Facebook login status."""
         try:
-            # Check for common elements that indicate logged-in state
-            indicators = [
-                # Navigation bar
-                "//div[@role='navigation']",
-                # Profile link
-                "//a[contains(@href, '/me') or contains(@href, '/profile.php')]",
-                # Create post
-                "//div[contains(text(), 'What') and contains(text(), 'on your mind')]",
-                # Account menu
-                "//div[@aria-label='Account' or contains(@aria-label, 'Your profile')]"
-            ]
-            
-            # Check for negative indicators
-            negative_indicators = [
-                # Login form
-                "//form[contains(@action, 'login')]",
-                # Login button
-                "//button[@name='login']",
-                # Create account button
-                "//a[contains(text(), 'Create New Account') or contains(text(), 'Sign Up')]"
-            ]
-            
-            # Count positive and negative indicators
-            positive_count = 0
-            for indicator in indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        positive_count += 1
-                except Exception:
-                    pass
-            
-            # Check for any negative indicators
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        return False  # Found negative indicator
-                except Exception:
-                    pass
+            # Count visible positive indicators and look for any visible negative one in a single script call
+            positive_count, negative_found = self.driver.execute_script(
+                _INDICATOR_COUNT_JS, _FACEBOOK_LOGGED_IN_XPATHS, _FACEBOOK_LOGGED_OUT_XPATHS
+            )
             
             # Must have at least 2 positive indicators and no negative indicators
-            return positive_count >= 2
+            return not negative_found and positive_count >= 2
         except Exception as e:
             self.logger.error(f"Error in comprehensive Facebook login check: {str(e)}")
             return False
@@ -695,59 +868,36 @@ class SocialMediaAuth:
     def _is_instagram_logged_in(self, extended_check=False):
         """Check if we're logged in to Instagram."""
         try:
+            # Evaluate every indicator in one in-page script instead of a WebDriver command per XPath
+            probe = self.driver.execute_script(
+                _LOGIN_CHECK_JS, _INSTAGRAM_NEGATIVE_XPATHS, _INSTAGRAM_PROFILE_XPATHS, _INSTAGRAM_PAGE_TEXT
+            )
+            
             # Check for negative indicators first - these always indicate we're NOT logged in
-            negative_indicators = [
-                "//form[contains(@id, 'loginForm')]",
-                "//button[contains(text(), 'Log In')]",
-                "//a[contains(text(), 'Sign up')]",
-                "//input[@name='username']",
-                "//input[@name='password']"
-            ]
-            
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        self.logger.info(f"Instagram login negative indicator found: {indicator}")
-                        return False  # Definitely not logged in
-                except Exception:
-                    pass
+            for indicator, visible in zip(_INSTAGRAM_NEGATIVE_XPATHS, probe['negative']):
+                if visible:
+                    self.logger.info(f"Instagram login negative indicator found: {indicator}")
+                    return False  # Definitely not logged in
             
-            # Basic check now
-            basic_check = (
-                "Search" in self.driver.page_source and
-                "Profile" in self.driver.page_source and
-                "Log In" not in self.driver.page_source
-            )
+            # Basic check now, from the substring flags the probe already returned
+            found = dict(zip(_INSTAGRAM_PAGE_TEXT, probe['text']))
+            basic_check = found["Search"] and found["Profile"] and not found["Log In"]
             
             if not basic_check:
                 self.logger.info("Instagram basic login check failed")
                 return False
                 
             # Always do extended check - it's more reliable
-            # Look for elements that definitively indicate logged-in state
-            try:
-                # Look for navigation elements or profile icon that only appear when logged in
-                nav_elements = self.driver.find_elements(By.XPATH, 
-                    "//a[contains(@href, '/direct/inbox/')] | //a[contains(@href, '/explore/')] | " +
-                    "//div[@role='navigation']//a[contains(@href, '/')] | //a[contains(@href, '/accounts/activity/')]")
-                
-                # If we find the avatar element, we're definitely logged in
-                avatar = self.driver.find_elements(By.XPATH, 
-                    "//img[@data-testid='user-avatar'] | //span[@role='link' and contains(@class, 'coreSpriteDesktopNavProfile')]")
-                
-                if len(nav_elements) == 0 and len(avatar) == 0:
-                    self.logger.info("Instagram profile elements not found")
-                    return False
-                
-                # Take a screenshot to verify login status
-                self._take_auth_screenshot("instagram_login_verification")
-                
-                self.logger.info("Instagram login verified via profile elements")
-                return True
-            except Exception as e:
-                self.logger.error(f"Error in Instagram extended login check: {str(e)}")
+            # Look for navigation elements or the avatar, which only appear when logged in
+            if not any(probe['positive']):
+                self.logger.info("Instagram profile elements not found")
                 return False
+            
+            # Take a screenshot to verify login status
+            self._take_auth_screenshot("instagram_login_verification")
+            
+            self.logger.info("Instagram login verified via profile elements")
+            return True
         except Exception as e:
             self.logger.error(f"Error checking Instagram login status: {str(e)}")
             return False
@@ -755,51 +905,13 @@ class SocialMediaAuth:
     def _is_instagram_logged_in_comprehensive(self):
         """Perform a comprehensive check to verify Instagram login status."""
         try:
-            # Check for common elements that indicate logged-in state
-            indicators = [
-                # Navigation bar
-                "//div[@role='navigation']",
-                # Direct messages icon
-                "//a[contains(@href, '/direct/inbox/')]",
-                # Profile icon
-                "//a[contains(@href, '/accounts/activity/')]",
-                # Home feed elements
-                "//div[@role='feed']",
-                # Search box
-                "//input[@placeholder='Search']"
-            ]
-            
-            # Check for negative indicators
-            negative_indicators = [
-                # Login form
-                "//form[contains(@id, 'loginForm')]",
-                # Login button
-                "//button[contains(text(), 'Log In')]",
-                # Sign up link
-                "//a[contains(text(), 'Sign up')]"
-            ]
-            
-            # Count positive and negative indicators
-            positive_count = 0
-            for indicator in indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        positive_count += 1
-                except Exception:
-                    pass
-            
-            # Check for any negative indicators
-            for indicator in negative_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and len(elements) > 0 and elements[0].is_displayed():
-                        return False  # Found negative indicator
-                except Exception:
-                    pass
+            # Count visible positive indicators and look for any visible negative one in a single script call
+            positive_count, negative_found = self.driver.execute_script(
+                _INDICATOR_COUNT_JS, _INSTAGRAM_LOGGED_IN_XPATHS, _INSTAGRAM_LOGGED_OUT_XPATHS
+            )
             
             # Must have at least 2 positive indicators and no negative indicators
-            return positive_count >= 2
+            return not negative_found and positive_count >= 2
         except Exception as e:
             self.logger.error(f"Error in comprehensive Instagram login check: {str(e)}")
             return False
@@ -852,7 +964,7 @@ class SocialMediaAuth:
             
             # Wait for login page to load and find username field
             try:
-                username_input = WebDriverWait(self.driver, 10).until(
+                username_input = self._wait10.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "input[name='username']"))
                 )
             except TimeoutException:
@@ -886,25 +998,18 @@ class SocialMediaAuth:
             # Wait for the page to load
             time.sleep(5)
             
-            # Check for "Save login info" dialog and click "Not Now" if exists
-            try:
-                save_info_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[text()='Not Now']"))
-                )
-                save_info_button.click()
-                time.sleep(2)
-            except TimeoutException:
-                self.logger.info("No 'Save login info' prompt detected on Instagram")
-            
-            # Check for "Turn on Notifications" dialog and click "Not Now" if exists
-            try:
-                notif_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[text()='Not Now']"))
-                )
-                notif_button.click()
+            # Dismiss the "Save login info" and "Turn on Notifications" dialogs if they show up.
+            # Both use a "Not Now" button; probe without waiting so absent dialogs cost nothing
+            for prompt in ("Save login info", "notification"):
+                not_now_buttons = self.driver.find_elements(By.XPATH, _INSTAGRAM_NOT_NOW_XPATH)
+                if not not_now_buttons:
+                    self.logger.info(f"No '{prompt}' prompt detected on Instagram")
+                    break
+                try:
+                    not_now_buttons[0].click()
+                except (ElementClickInterceptedException, StaleElementReferenceException, ElementNotInteractableException):
+                    self.driver.execute_script("arguments[0].click();", not_now_buttons[0])
                 time.sleep(2)
-            except TimeoutException:
-                self.logger.info("No notification prompt detected on Instagram")
             
             # Verify login success
             time.sleep(3)  # Give page time to load fully
@@ -989,7 +1094,7 @@ class SocialMediaAuth:
             
             # Wait for login page to load and find email field
             try:
-                email_input = WebDriverWait(self.driver, 10).until(
+                email_input = self._wait10.until(
                     EC.element_to_be_clickable((By.ID, "email"))
                 )
             except TimeoutException:
@@ -1089,7 +1194,7 @@ class SocialMediaAuth:
             
             # Wait for login page to load and find username/email field
             try:
-                username_input = WebDriverWait(self.driver, 10).until(
+                username_input = self._wait10.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "input[autocomplete='username']"))
                 )
             except TimeoutException:
@@ -1108,7 +1213,7 @@ class SocialMediaAuth:
             
             # Click the Next button 
             try:
-                next_button = WebDriverWait(self.driver, 10).until(
+                next_button = self._wait10.until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='button'][.//span[contains(text(), 'Next')]]"))
                 )
                 next_button.click()
@@ -1119,13 +1224,13 @@ class SocialMediaAuth:
             
             # Check if we need to enter our username for verification (if we logged in with email)
             try:
-                username_verification = WebDriverWait(self.driver, 5).until(
+                username_verification = self._wait5.until(
                     EC.presence_of_element_located((By.XPATH, "//input[@data-testid='ocfEnterTextTextInput']"))
                 )
                 if username_verification and self.credentials[platform]['username']:
                     self._type_like_human(username_verification, self.credentials[platform]['username'])
                     # Click the Next button again
-                    verify_button = WebDriverWait(self.driver, 5).until(
+                    verify_button = self._wait5.until(
                         EC.element_to_be_clickable((By.XPATH, "//div[@role='button'][.//span[contains(text(), 'Next')]]"))
                     )
                     verify_button.click()
@@ -1135,7 +1240,7 @@ class SocialMediaAuth:
             
             # Now enter password
             try:
-                password_input = WebDriverWait(self.driver, 10).until(
+                password_input = self._wait10.until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='password']"))
                 )
                 password_input.clear()
@@ -1149,7 +1254,7 @@ class SocialMediaAuth:
             
             # Click the Log in button
             try:
-                login_button = WebDriverWait(self.driver, 10).until(
+                login_button = self._wait10.until(
                     EC.element_to_be_clickable((By.XPATH, "//div[@role='button'][.//span[contains(text(), 'Log in')]]"))
                 )
                 login_button.click()